@@ -33,21 +33,49 @@ class CommandRunner(QThread):
 
     Signals:
     output_signal(str, str): Emits each line of output with a tag ("Output" or "Error").
+    output_lines_signal(list, str): With batch_lines=True, emits all lines of one read at once instead.
 
     """
     output_signal = pyqtSignal(str, str)
+    output_lines_signal = pyqtSignal(list, str)
 
-    def __init__(self, command: str, platform_tools_path: str, env: dict = None):
+    def __init__(self, command: str, platform_tools_path: str, env: dict = None, batch_lines: bool = False):
         super().__init__()
         self.command = command
         self.platform_tools_path = platform_tools_path
         self.env = env
+        self.batch_lines = batch_lines
+        self.returncode = None  # exit code of the command once run() returns
+
+    def _emit_lines(self, data: bytes, tag: str):
+        """Decodes a run of complete lines and emits them one by one (\r, \n and \r\n all end a line)."""
+        text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+        if text.endswith("\n"):
+            text = text[:-1]
+        if self.batch_lines:
+            # one queued signal per read instead of per line keeps the GUI's event queue short
+            self.output_lines_signal.emit(text.split("\n"), tag)
+            return
+        for line in text.split("\n"):
+            self.output_signal.emit(line, tag)
 
     def _stream_reader(self, stream, tag: str):
-        """Reads a stream line-by-line and emits lines via a signal."""
+        """Reads a stream in 64K chunks and emits it line by line via a signal."""
         try:
-            for line in iter(stream.readline, ''):
-                self.output_signal.emit(line.rstrip("\n"), tag)
+            fd = stream.fileno()
+            pending = b""
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                pending += chunk
+                # emit up to the last line break; a trailing \r may be the first half of \r\n, so it waits
+                cut = max(pending.rfind(b"\n"), pending.rfind(b"\r", 0, len(pending) - 1))
+                if cut >= 0:
+                    self._emit_lines(pending[:cut + 1], tag)
+                    pending = pending[cut + 1:]
+            if pending:
+                self._emit_lines(pending, tag)
         except Exception as e:
             self.output_signal.emit(f"Reader error: {e}", "Error")
         finally:
@@ -73,8 +101,7 @@ class CommandRunner(QThread):
                 stderr=subprocess.PIPE,
                 shell=True,
                 cwd=self.platform_tools_path,
-                text=True,
-                bufsize=1,  # Line-buffered
+                bufsize=0,  # raw pipes; the readers split lines themselves
                 env=self.env,
                 creationflags=creationflags
             )
@@ -86,7 +113,7 @@ class CommandRunner(QThread):
             t_out.start()
             t_err.start()
 
-            process.wait()  # Wait for the subprocess to complete
+            self.returncode = process.wait()  # Wait for the subprocess to complete
             t_out.join()    # Ensure threads finish
             t_err.join()
 
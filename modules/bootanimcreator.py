@@ -10,7 +10,14 @@ import shutil
 import tempfile
 import zipfile
 import subprocess
+import shlex
+import io
 import time
+import functools
+import hashlib
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
 
@@ -29,8 +36,8 @@ from PyQt6.QtWidgets import (
     QFileDialog, QMessageBox, QSpinBox, QGroupBox, QLineEdit, QTextEdit, QGridLayout,
     QDialog, QFormLayout, QDialogButtonBox, QPlainTextEdit, QSlider
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
-from PyQt6.QtGui import QPixmap, QDesktopServices
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl, QSize, QBuffer, QIODevice
+from PyQt6.QtGui import QPixmap, QImage, QDesktopServices
 
 from PIL import Image, ImageSequence
 
@@ -50,6 +57,17 @@ BOOT_PATHS = [
     "/vendor/media/bootanimation.zip",
 ]
 
+IMG_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".bmp")
+
+# Qt enum members bound once; the per-frame scaling path would otherwise resolve each through two attribute lookups
+_KEEP_ASPECT = Qt.AspectRatioMode.KeepAspectRatio
+_IGNORE_ASPECT = Qt.AspectRatioMode.IgnoreAspectRatio
+_SMOOTH = Qt.TransformationMode.SmoothTransformation
+_FAST = Qt.TransformationMode.FastTransformation
+
+_NUM_RE = re.compile(r"\d+")
+_PART_RE = re.compile(r"part(\d+)", re.IGNORECASE)
+
 # placeholders for globals that will be set by ensure_work_dirs()
 WORK_DIR = None
 EXTRACT_DIR = None
@@ -57,10 +75,21 @@ PULLED_ZIP = None
 CREATED_ZIP_DEFAULT = None
 
 
+def _now_ms() -> int:
+    """Monotonic milliseconds for playback timing (immune to wall-clock jumps)."""
+    return time.monotonic_ns() // 1_000_000
+
+
+@functools.lru_cache(maxsize=1)
+def _which_ffmpeg() -> str:
+    """Cached PATH lookup for ffmpeg; cleared when the user edits the ffmpeg path."""
+    return shutil.which("ffmpeg") or ""
+
+
 def _frame_sort_key(path_or_name: str):
     """Sort key for frame files: numeric suffix first, then lexicographic fallback."""
     nm = os.path.basename(path_or_name)
-    nums = re.findall(r"\d+", nm)
+    nums = _NUM_RE.findall(nm)
     if nums:
         try:
             return (0, int(nums[-1]), "")
@@ -70,16 +99,20 @@ def _frame_sort_key(path_or_name: str):
 
 
 class FrameLoaderWorker(QThread):
+    """Decode and scale frames off the GUI thread. Emits QImages; QPixmaps must be made on the GUI thread."""
     progress = pyqtSignal(int, int)  # current, total
-    finished_seq = pyqtSignal(list, int)  # sequence, frame_ms
+    # [QImage], [frame name], [raw file bytes or None], [start frame of each image], total frames, frame_ms
+    finished_seq = pyqtSignal(list, list, list, list, int, int)
     error = pyqtSignal(str)
 
-    def __init__(self, folders: List[str], width: int, height: int, fps: int):
+    def __init__(self, folders: List[str], width: int, height: int, fps: int, keep_raw: bool = False):
         super().__init__()
         self.folders = folders
         self.width = width
         self.height = height
         self.fps = fps
+        # keep each frame's encoded file bytes so it can be repackaged without a decode/re-encode
+        self.keep_raw = keep_raw
 
     def run(self):
         try:
@@ -91,7 +124,8 @@ class FrameLoaderWorker(QThread):
             frame_ms = int(1000 / max(1, self.fps))
             all_files = []
             for d in valid_folders:
-                files = [os.path.join(d, f) for f in os.listdir(d) if f.lower().endswith((".png", ".jpg", ".jpeg", ".webp"))]
+                with os.scandir(d) as it:
+                    files = [e.path for e in it if e.is_file() and e.name.lower().endswith(IMG_EXTS)]
                 files.sort(key=_frame_sort_key)
                 all_files.extend(files)
 
@@ -100,19 +134,57 @@ class FrameLoaderWorker(QThread):
                 return
 
             total = len(all_files)
-            seq = []
-            for i, fpath in enumerate(all_files):
-                pix = QPixmap(fpath)
-                if pix.isNull():
-                    continue
-                pix = pix.scaled(self.width, self.height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                seq.append((pix, frame_ms, os.path.basename(fpath)))
-                self.progress.emit(i + 1, total)
-
-            self.finished_seq.emit(seq, frame_ms)
+            images = []
+            names = []
+            raws = []
+            starts = []
+            frames = 0
+            last_digest = None
+            # Qt's image decoders and scaler release the GIL, so frames decode in parallel; map keeps order
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                for i, (fpath, (img, raw, digest)) in enumerate(zip(all_files, pool.map(self._load_scaled, all_files))):
+                    if img is None:
+                        continue
+                    # held frames (same file bytes as the previous frame) only extend the previous image's run
+                    if digest != last_digest:
+                        images.append(img)
+                        names.append(os.path.basename(fpath))
+                        raws.append(raw)
+                        starts.append(frames)
+                        last_digest = digest
+                    frames += 1
+                    self.progress.emit(i + 1, total)
+
+            self.finished_seq.emit(images, names, raws, starts, frames, frame_ms)
         except Exception as e:
             self.error.emit(str(e))
 
+    def _load_scaled(self, fpath: str) -> Tuple[Optional[QImage], Optional[bytes], Optional[bytes]]:
+        with open(fpath, "rb") as f:
+            data = f.read()
+        img = QImage.fromData(data)
+        if img.isNull():
+            return None, None, None
+        return self._fit(img), (data if self.keep_raw else None), _frame_digest(data)
+
+    def _fit(self, img: QImage) -> QImage:
+        return fit_image(img, self.width, self.height)
+
+
+def _frame_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def fit_image(img: QImage, width: int, height: int) -> QImage:
+    """Scale img to fit the target box, skipping no-op scales and prescaling large downscales."""
+    target = img.size().scaled(width, height, _KEEP_ASPECT)
+    if target == img.size():
+        return img
+    if img.width() > 2 * target.width() and img.height() > 2 * target.height():
+        # cheap nearest-neighbour pass to 2x target, so the smooth filter touches ~4x fewer pixels
+        img = img.scaled(QSize(2 * target.width(), 2 * target.height()), _IGNORE_ASPECT, _FAST)
+    return img.scaled(target, _IGNORE_ASPECT, _SMOOTH)
+
 
 class FuncThread(QThread):
     done = pyqtSignal(object, object)
@@ -206,7 +278,7 @@ def pull_root_zip_sync(remote_path: str, adb_cmd: str = None, local_dest: str =
             pull_cmd = adb_base + ["pull", tmp_remote, local_dest]
             pull = subprocess.run(pull_cmd, capture_output=True, text=True, timeout=90, creationflags=creationflags)
             if pull.returncode == 0 and os.path.exists(local_dest):
-                subprocess.run(adb_base + ["shell", "su", "-c", f'rm "{tmp_remote}"'], capture_output=True, creationflags=creationflags)
+                subprocess.run(adb_base + ["shell", "su", "-c", f'rm "{tmp_remote}"'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
                 return True
     except Exception:
         pass
@@ -228,7 +300,7 @@ def pull_root_zip_sync(remote_path: str, adb_cmd: str = None, local_dest: str =
             if proc2.returncode == 0:
                 pull = subprocess.run(adb_base + ["pull", tmp_remote, local_dest], capture_output=True, text=True, timeout=90, creationflags=creationflags)
                 if pull.returncode == 0 and os.path.exists(local_dest):
-                    subprocess.run(adb_base + ["shell", "su", "-c", f'rm "{tmp_remote}"'], capture_output=True, creationflags=creationflags)
+                    subprocess.run(adb_base + ["shell", "su", "-c", f'rm "{tmp_remote}"'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
                     return True
     except Exception:
         pass
@@ -271,7 +343,8 @@ def parse_pulled_zip_sync(zip_path: str) -> Optional[Dict]:
         folder_path = candidate if os.path.isdir(candidate) else None
         frame_count = 0
         if folder_path:
-            frame_count = len([f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))])
+            with os.scandir(folder_path) as it:
+                frame_count = sum(1 for e in it if e.is_file())
         parts.append({
             "mode": mode, "loops": loops, "folder": folder, "pause": pause,
             "frame_count": frame_count, "folder_path": folder_path
@@ -279,11 +352,38 @@ def parse_pulled_zip_sync(zip_path: str) -> Optional[Dict]:
     return {"width": w, "height": h, "fps": fps, "parts": parts}
 
 
-def extract_video_frames_sync(video_path: str, width: int, height: int, ffmpeg_path: str, fps: Optional[int] = None) -> str:
-    """
-    Extract frames from video using ffmpeg into a temporary directory and return that dir path.
-    Raises on failure.
-    """
+_HWACCEL_CACHE: Dict[str, bool] = {}
+_HWACCEL_NAMES = ("cuda", "vaapi", "d3d11va")
+# below this output size hwaccel setup costs more than it saves
+_HWACCEL_MIN_PIXELS = 480 * 270
+
+
+def _ffmpeg_has_hwaccel(ffmpeg_bin: str) -> bool:
+    """Probe `ffmpeg -hwaccels` once per binary and cache whether a usable decoder is present."""
+    cached = _HWACCEL_CACHE.get(ffmpeg_bin)
+    if cached is not None:
+        return cached
+    # Windows specific: Create a new process group and hide the console window.
+    creationflags = 0
+    if os.name == 'nt':
+        creationflags = (
+            subprocess.CREATE_NEW_PROCESS_GROUP |
+            subprocess.CREATE_NO_WINDOW
+        )
+    found = False
+    try:
+        proc = subprocess.run([ffmpeg_bin, "-hide_banner", "-hwaccels"], capture_output=True, text=True,
+                              timeout=6, creationflags=creationflags)
+        names = {ln.strip().lower() for ln in (proc.stdout or "").splitlines()}
+        found = any(n in names for n in _HWACCEL_NAMES)
+    except Exception:
+        pass
+    _HWACCEL_CACHE[ffmpeg_bin] = found
+    return found
+
+
+def _ffmpeg_input_args(video_path: str, width: int, height: int, ffmpeg_path: str, fps: Optional[int]) -> List[str]:
+    """Build the ffmpeg command up to (not including) the output; shared by the file and pipe extractors."""
     if not os.path.isfile(video_path):
         raise FileNotFoundError("Video file missing")
     # resolve ffmpeg path: prefer provided exact path, otherwise search PATH
@@ -291,27 +391,37 @@ def extract_video_frames_sync(video_path: str, width: int, height: int, ffmpeg_p
     if ff and os.path.isfile(ff):
         ffmpeg_bin = ff
     else:
-        ffmpeg_bin = shutil.which(ff) or shutil.which("ffmpeg")
+        ffmpeg_bin = (shutil.which(ff) if ff else None) or _which_ffmpeg()
     if not ffmpeg_bin:
         raise FileNotFoundError("ffmpeg not found")
-    out_dir = tempfile.mkdtemp(prefix="bootanim_vid_", dir=WORK_DIR)
-    out_pattern = os.path.join(out_dir, "%09d.png")
-    args = [ffmpeg_bin, "-y", "-i", video_path]
+    args = [ffmpeg_bin, "-y", "-threads", "0"]
+    if width * height > _HWACCEL_MIN_PIXELS and _ffmpeg_has_hwaccel(ffmpeg_bin):
+        args += ["-hwaccel", "auto"]
+    args += ["-i", video_path]
     # force FPS if provided
     if fps and isinstance(fps, int) and fps > 0:
         args += ["-r", str(fps)]
     if width > 0 and height > 0:
         args += ["-vf", f"scale={width}:{height}:flags=lanczos"]
-    args += [out_pattern]
+    return args
+
+
+def _ffmpeg_creationflags() -> int:
     # Windows specific: Create a new process group and hide the console window.
-    creationflags = 0
     if os.name == 'nt':
-        creationflags = (
-            subprocess.CREATE_NEW_PROCESS_GROUP |
-            subprocess.CREATE_NO_WINDOW
-        )
+        return subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+    return 0
+
 
-    proc = subprocess.run(args, capture_output=True, text=True, timeout=600, creationflags=creationflags)
+def extract_video_frames_sync(video_path: str, width: int, height: int, ffmpeg_path: str, fps: Optional[int] = None) -> str:
+    """
+    Extract frames from video using ffmpeg into a temporary directory and return that dir path.
+    Raises on failure.
+    """
+    args = _ffmpeg_input_args(video_path, width, height, ffmpeg_path, fps)
+    out_dir = tempfile.mkdtemp(prefix="bootanim_vid_", dir=WORK_DIR)
+    args += [os.path.join(out_dir, "%09d.png")]
+    proc = subprocess.run(args, capture_output=True, text=True, timeout=600, creationflags=_ffmpeg_creationflags())
     if proc.returncode != 0:
         try:
             shutil.rmtree(out_dir)
@@ -321,21 +431,139 @@ def extract_video_frames_sync(video_path: str, width: int, height: int, ffmpeg_p
     return out_dir
 
 
-def extract_gif_frames_sync(gif_path: str, width: int, height: int, fps: Optional[int] = None) -> str:
+def iter_video_frames(video_path: str, width: int, height: int, ffmpeg_path: str, fps: Optional[int] = None):
+    """
+    Yield width x height RGBA QImages decoded by ffmpeg straight from its stdout, no frames touch the disk.
+    Raises RuntimeError if ffmpeg exits non-zero.
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("Frame size must be set to stream video frames")
+    args = _ffmpeg_input_args(video_path, width, height, ffmpeg_path, fps)
+    args += ["-f", "rawvideo", "-pix_fmt", "rgba", "pipe:1"]
+    frame_size = width * height * 4
+    # stderr goes to a file so a chatty ffmpeg can never fill the pipe and stall the frame reads
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=err,
+                                creationflags=_ffmpeg_creationflags())
+        try:
+            buf = bytearray(frame_size)
+            view = memoryview(buf)
+            while True:
+                got = 0
+                while got < frame_size:
+                    n = proc.stdout.readinto(view[got:])
+                    if not n:
+                        break
+                    got += n
+                if got < frame_size:
+                    break
+                # copy() detaches the image from the reused buffer
+                yield QImage(buf, width, height, width * 4, QImage.Format.Format_RGBA8888).copy()
+            rc = proc.wait()
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        if rc != 0:
+            err.seek(0)
+            raise RuntimeError(f"ffmpeg failed: {err.read()[-1000:].decode('utf-8', 'replace')}")
+
+
+def _encode_png(img: QImage) -> bytes:
+    qbuf = QBuffer()
+    qbuf.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not img.save(qbuf, "PNG"):
+        raise RuntimeError("QImage.save returned False")
+    return bytes(qbuf.data())
+
+
+def _preview_and_png(img: QImage, preview_w: int, preview_h: int) -> Tuple[QImage, bytes]:
+    return fit_image(img, preview_w, preview_h), _encode_png(img)
+
+
+def decode_video_frames_sync(video_path: str, width: int, height: int, ffmpeg_path: str, fps: Optional[int],
+                             preview_w: int, preview_h: int) -> Tuple[List[QImage], List[bytes], List[int], int]:
+    """
+    Stream a video through ffmpeg and return (preview-sized frames, output-sized PNG bytes, start frame of each, total frames).
+    Runs of identical frames are kept once. Full-size frames are only held while they are being encoded.
+    """
+    previews: List[QImage] = []
+    pngs: List[bytes] = []
+    starts: List[int] = []
+    frames = 0
+    last_digest = None
+    pending = deque()
+
+    def collect(fut):
+        nonlocal frames, last_digest
+        preview, data = fut.result()
+        digest = _frame_digest(data)
+        if digest != last_digest:
+            previews.append(preview)
+            pngs.append(data)
+            starts.append(frames)
+            last_digest = digest
+        frames += 1
+
+    # PNG encode and preview scaling release the GIL; a bounded window keeps memory flat on long clips
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for img in iter_video_frames(video_path, width, height, ffmpeg_path, fps):
+            pending.append(pool.submit(_preview_and_png, img, preview_w, preview_h))
+            if len(pending) >= 2 * (os.cpu_count() or 1):
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+    return previews, pngs, starts, frames
+
+
+def ffmpeg_version_sync(ffmpeg_bin: str) -> str:
+    """Run `ffmpeg -version` and return the first line of its output. Raises on failure."""
+    # Windows specific: Create a new process group and hide the console window.
+    creationflags = 0
+    if os.name == 'nt':
+        creationflags = (
+            subprocess.CREATE_NEW_PROCESS_GROUP |
+            subprocess.CREATE_NO_WINDOW
+        )
+    proc = subprocess.run([ffmpeg_bin, "-version"], capture_output=True, text=True, timeout=6, creationflags=creationflags)
+    out = proc.stdout or proc.stderr or ""
+    return out.splitlines()[0] if out.splitlines() else out.strip()
+
+
+def find_ffmpeg_sync() -> Tuple[Optional[str], Optional[str]]:
+    """Locate ffmpeg in PATH and read its version. Returns (path, version line) or (None, None)."""
+    path = _which_ffmpeg()
+    if not path:
+        return None, None
+    return path, ffmpeg_version_sync(path)
+
+
+def extract_gif_frames_sync(gif_path: str, width: int, height: int, fps: Optional[int] = None, quality: str = "best") -> str:
     """
     Extract frames from GIF into a temporary folder using Pillow and return that dir.
+    quality "fast" resizes with BILINEAR (preview only), "best" with LANCZOS (final output).
     """
     if not os.path.isfile(gif_path):
         raise FileNotFoundError("GIF file missing")
     out_dir = tempfile.mkdtemp(prefix="bootanim_gif_", dir=WORK_DIR)
+    resample = Image.Resampling.BILINEAR if quality == "fast" else Image.Resampling.LANCZOS
     im = Image.open(gif_path)
+    # only keep an alpha channel when the GIF actually declares transparency
+    mode = "RGBA" if "transparency" in im.info or im.mode == "RGBA" else "RGB"
     i = 0
-    for frame in ImageSequence.Iterator(im):
-        frame = frame.convert("RGBA")
-        if width > 0 and height > 0:
-            frame = frame.resize((width, height), Image.Resampling.LANCZOS)
-        frame.save(os.path.join(out_dir, f"{i:09d}.png"))
-        i += 1
+    # PNG encode releases the GIL, so saves overlap with decoding/resizing the next frame
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = []
+        for frame in ImageSequence.Iterator(im):
+            frame = frame.convert(mode)
+            if width > 0 and height > 0:
+                frame = frame.resize((width, height), resample)
+            futures.append(pool.submit(frame.save, os.path.join(out_dir, f"{i:09d}.png"), "PNG",
+                                       compress_level=1, optimize=False))
+            i += 1
+        for fut in futures:
+            fut.result()
     if i == 0:
         shutil.rmtree(out_dir)
         raise RuntimeError("No frames extracted from GIF")
@@ -343,26 +571,54 @@ def extract_gif_frames_sync(gif_path: str, width: int, height: int, fps: Optiona
 
 
 # ---------- Module creation helpers ----------
+_ZIP_READ_WORKERS = 4
+_ZIP_MAX_PENDING = 8  # files read ahead of the zip writer
+
+
+def _read_file_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _iter_tree_files(root: str, prefix: str = ""):
+    """Yield (path, zip-relative name, stat) for every file under root using os.scandir."""
+    with os.scandir(root) as it:
+        for entry in it:
+            rel = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_tree_files(entry.path, rel + "/")
+            elif entry.is_file():
+                yield entry.path, rel, entry.stat()
+
+
 def _make_zip_with_permissions(root_dir: str, out_zip: str, perms: Dict[str, int] = None):
     """
     Create zip file from root_dir and set unix permissions for files specified in perms (relpath->mode).
     perms is optional dict mapping relative path inside zip to unix mode (e.g. 0o755).
+    Files are read on worker threads while this thread is the only writer to the zip.
     """
     if perms is None:
         perms = {}
-    with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_STORED) as zf:
-        for rootp, dirs, files in os.walk(root_dir):
-            for fn in files:
-                full = os.path.join(rootp, fn)
-                rel = os.path.relpath(full, root_dir)
-                # zipfile internally uses forward slashes, so normalize for the lookup
-                rel_zip = rel.replace("\\", "/")
-                zf.write(full, rel_zip)
-                # set external attr for permissions if provided
-                if rel_zip in perms:
-                    info = zf.getinfo(rel_zip)
-                    # mode in upper 16 bits
-                    info.external_attr = (perms[rel_zip] & 0xFFFF) << 16
+    # perms keys may come from os.path.relpath, so normalize them to the zip's forward slashes
+    perms = {k.replace("\\", "/"): v for k, v in perms.items()}
+
+    def write_entry(zf, st, rel_zip, fut):
+        # build the ZipInfo from the cached DirEntry stat instead of letting zipfile stat again
+        info = zipfile.ZipInfo(rel_zip, time.localtime(st.st_mtime)[0:6])
+        # mode in upper 16 bits; explicit perms win over the on-disk mode
+        mode = perms.get(rel_zip, st.st_mode)
+        info.external_attr = (mode & 0xFFFF) << 16
+        zf.writestr(info, fut.result(), compress_type=zipfile.ZIP_STORED)
+
+    with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_STORED) as zf, \
+            ThreadPoolExecutor(max_workers=_ZIP_READ_WORKERS) as ex:
+        pending = deque()
+        for full, rel_zip, st in _iter_tree_files(root_dir):
+            pending.append((st, rel_zip, ex.submit(_read_file_bytes, full)))
+            if len(pending) >= _ZIP_MAX_PENDING:
+                write_entry(zf, *pending.popleft())
+        while pending:
+            write_entry(zf, *pending.popleft())
 
 
 def create_module_sync(module_meta: Dict[str, str], save_zip: str, created_boot_zip: str, remote_path: str, alias: str):
@@ -375,8 +631,8 @@ def create_module_sync(module_meta: Dict[str, str], save_zip: str, created_boot_
     if not created_boot_zip or not os.path.exists(created_boot_zip):
         raise RuntimeError("Created bootanimation.zip missing. Create it first.")
 
-    tmp_mod = tempfile.mkdtemp(prefix="qadb_module_")
-    try:
+    # the context manager's fd-based tree removal replaces the manual mkdtemp + rmtree cleanup
+    with tempfile.TemporaryDirectory(prefix="qadb_module_", ignore_cleanup_errors=True) as tmp_mod:
         # Determine internal module path components (drop leading slash)
         rp = remote_path.lstrip("/")
         parts = rp.split("/")[:-1]  # directory components (exclude filename)
@@ -424,11 +680,6 @@ def create_module_sync(module_meta: Dict[str, str], save_zip: str, created_boot_
         perms[rel_boot] = 0o644
         _make_zip_with_permissions(tmp_mod, save_zip, perms=perms)
         return f"Module created: {save_zip}"
-    finally:
-        try:
-            shutil.rmtree(tmp_mod)
-        except Exception:
-            pass
 
 
 # ---------- GUI and main widget ----------
@@ -551,21 +802,39 @@ class BootAnimWidget(QWidget):
         self.backup_dir = os.path.join(root_dir, "bootanim_backups")
         os.makedirs(self.backup_dir, exist_ok=True)
 
-        self.seq_current: List[Tuple[QPixmap, int]] = []
-        self.seq_created: List[Tuple[QPixmap, int]] = []
-
+        # frames and their source names are kept as parallel lists; every frame shares frame_ms_*.
+        # identical consecutive frames are stored once: starts_* holds the first frame index of each
+        # stored image and frames_total_* the full length, so an image is shown until the next start
+        # frames stay CPU-side QImages; only the frame on screen is turned into a QPixmap
+        self.seq_current: List[QImage] = []
+        self.seq_created: List[QImage] = []
+        self.names_current: List[str] = []
+        self.names_created: List[str] = []
+        self.starts_current: List[int] = []
+        self.starts_created: List[int] = []
+        self.frames_total_current = 0
+        self.frames_total_created = 0
+        # original encoded bytes of each created frame (full size, not preview-scaled)
+        self._seq_created_bytes: List[Optional[bytes]] = []
+
+        # one tick per frame; precise timers avoid coarse-timer slack of up to 5% of the interval
         self.timer_current = QTimer(self)
         self.timer_created = QTimer(self)
+        self.timer_current.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer_created.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer_current.timeout.connect(self._tick_current)
         self.timer_created.timeout.connect(self._tick_created)
         self.play_index_current = 0
         self.play_index_created = 0
         self.playing_current = False
         self.playing_created = False
+        # image currently set on each label, so held frames aren't converted again every tick
+        self.shown_current: Optional[QImage] = None
+        self.shown_created: Optional[QImage] = None
 
         self._threads: List[QThread] = []
 
-        self.ffmpeg_resolved_path = shutil.which("ffmpeg") or ""
+        self.ffmpeg_resolved_path = _which_ffmpeg()
         self.ffmpeg_path = self.ffmpeg_resolved_path
 
         # selected animation file (video or gif) to be previewed / decoded
@@ -573,10 +842,15 @@ class BootAnimWidget(QWidget):
 
         # remember last frames dir briefly before cleanup (we will delete extracted frames after loading into RAM)
         self._last_created_frames_dir: Optional[str] = None
+        # GIF previews are resized with a fast filter; remember the source so the zip can be rebuilt at full quality
+        self._created_frames_src: Optional[str] = None
+        self._created_frames_quality = "best"
+        # (width, height, fps) the preview frames were extracted with; the full-quality pass must match them
+        self._created_frames_params: Optional[Tuple[int, int, int]] = None
 
         self._build_ui()
-        # setup status bar (manually since QWidget doesn't have it by default, but we'll add it to layout)
-        QTimer.singleShot(150, self._startup_ffmpeg_check)
+        # probe ffmpeg off the UI thread so the window paints immediately
+        self._startup_ffmpeg_check()
 
     def _build_ui(self):
         root = QVBoxLayout(self)
@@ -621,6 +895,7 @@ class BootAnimWidget(QWidget):
         ff_layout = QHBoxLayout()
         self.ffmpeg_edit = QLineEdit(self.ffmpeg_resolved_path)
         self.ffmpeg_edit.setPlaceholderText("ffmpeg path (or leave blank to use PATH)")
+        self.ffmpeg_edit.textEdited.connect(lambda _: _which_ffmpeg.cache_clear())
         self.ff_browse = QPushButton("Browse"); self.ff_browse.setFixedSize(80, 28); self.ff_browse.clicked.connect(self.browse_ffmpeg)
         self.ff_check = QPushButton("Check"); self.ff_check.setFixedSize(80, 28); self.ff_check.clicked.connect(self.check_ffmpeg)
         ff_layout.addWidget(self.ffmpeg_edit); ff_layout.addWidget(self.ff_browse); ff_layout.addWidget(self.ff_check)
@@ -724,12 +999,23 @@ class BootAnimWidget(QWidget):
         self.log_text.ensureCursorVisible()
 
     def _startup_ffmpeg_check(self):
-        path = shutil.which("ffmpeg")
-        if path:
-            self.log(f"ffmpeg found in PATH")
-            self._check_ffmpeg_version(path, silent=True)
-        else:
+        t = FuncThread(find_ffmpeg_sync)
+        t.done.connect(self._on_startup_ffmpeg_done)
+        self._start_thread(t)
+
+    def _on_startup_ffmpeg_done(self, result, error):
+        if error:
+            self.log(f"ffmpeg check failed: {error}")
+            return
+        path, first = result
+        if not path:
             self.log("ffmpeg not found in PATH")
+            return
+        self.log("ffmpeg found in PATH")
+        self.log(f"ffmpeg: {first}")
+        self.ffmpeg_resolved_path = path
+        self.ffmpeg_path = path
+        self.ffmpeg_edit.setText(path)
 
     def browse_ffmpeg(self):
         p, _ = QFileDialog.getOpenFileName(self, "Locate ffmpeg binary")
@@ -739,25 +1025,15 @@ class BootAnimWidget(QWidget):
         self.check_ffmpeg()
 
     def check_ffmpeg(self):
-        p = self.ffmpeg_edit.text().strip() or shutil.which("ffmpeg") or ""
+        p = self.ffmpeg_edit.text().strip() or _which_ffmpeg()
         if not p:
             QMessageBox.warning(self, "FFmpeg", "FFmpeg not set and not found in PATH.")
             return
         self._check_ffmpeg_version(p, silent=False)
 
     def _check_ffmpeg_version(self, p, silent=False):
-        # Windows specific: Create a new process group and hide the console window.
-        creationflags = 0
-        if os.name == 'nt':
-            creationflags = (
-                subprocess.CREATE_NEW_PROCESS_GROUP |
-                subprocess.CREATE_NO_WINDOW
-            )
-
         try:
-            proc = subprocess.run([p, "-version"], capture_output=True, text=True, timeout=6, creationflags=creationflags)
-            out = proc.stdout or proc.stderr or ""
-            first = out.splitlines()[0] if out.splitlines() else out.strip()
+            first = ffmpeg_version_sync(p)
             self.log(f"ffmpeg: {first}")
             self.ffmpeg_resolved_path = p
             self.ffmpeg_path = p
@@ -881,18 +1157,17 @@ class BootAnimWidget(QWidget):
     def build_sequence_from_info(self, info: Dict, which: str = "current"):
         fps = int(info.get("fps", 30) or 30)
         def part_index(name: str):
-            m = re.fullmatch(r"part(\d+)", name, flags=re.IGNORECASE)
+            m = _PART_RE.fullmatch(name)
             return int(m.group(1)) if m else None
         
         folders = []
         if os.path.isdir(EXTRACT_DIR):
             part_dirs = []
-            for name in os.listdir(EXTRACT_DIR):
-                idx = part_index(name)
-                if idx is not None:
-                    p = os.path.join(EXTRACT_DIR, name)
-                    if os.path.isdir(p):
-                        part_dirs.append((idx, p))
+            with os.scandir(EXTRACT_DIR) as it:
+                for e in it:
+                    idx = part_index(e.name)
+                    if idx is not None and e.is_dir():
+                        part_dirs.append((idx, e.path))
             part_dirs.sort(key=lambda t: t[0])
             folders = [p for _, p in part_dirs]
 
@@ -908,34 +1183,47 @@ class BootAnimWidget(QWidget):
 
     def _launch_loader(self, folders: list, target_w: int, target_h: int, fps: int, which: str):
         """Create, wire, and start a FrameLoaderWorker."""
-        loader = FrameLoaderWorker(folders, target_w, target_h, fps)
+        loader = FrameLoaderWorker(folders, target_w, target_h, fps, keep_raw=(which == "created"))
         loader._which = which
         loader.finished_seq.connect(self._on_loader_done)
         loader.error.connect(lambda e: self.log(f"[ERROR] Loader error: {e}"))
         self._start_thread(loader)
 
-    def _on_loader_done(self, seq, frame_ms):
+    def _on_loader_done(self, images, names, raws, starts, total, frame_ms):
         loader = self.sender()
         which = getattr(loader, "_which", "created")
-        if not seq:
+        if not images:
             self.log(f"[WARN] No frames loaded for outline ('{which}').")
             QMessageBox.information(self, "Preview", "No frames were loaded for preview. See log for details.")
             return
 
-        self.log(f"[INFO] Loaded {len(seq)} frames for '{which}'.")
-        
+        self.log(f"[INFO] Loaded {total} frames for '{which}' ({len(images)} unique).")
+        self._apply_sequence(which, images, names, raws, starts, total, frame_ms)
+
+    def _apply_sequence(self, which: str, images: List[QImage], names: List[str], raws: list,
+                        starts: List[int], total: int, frame_ms: int):
+        seq = images
         if which == "current":
+            self.shown_current = None
             self.seq_current = seq
+            self.names_current = names
+            self.starts_current = starts
+            self.frames_total_current = total
             self.play_index_current = 0
             self.frame_ms_current = frame_ms
-            self.cur_seek.setRange(0, len(seq) - 1)
+            self.cur_seek.setRange(0, total - 1)
             self.cur_seek.setEnabled(True)
             self.start_current()
         else:
+            self.shown_created = None
             self.seq_created = seq
+            self.names_created = names
+            self.starts_created = starts
+            self.frames_total_created = total
+            self._seq_created_bytes = raws
             self.play_index_created = 0
             self.frame_ms_created = frame_ms
-            self.new_seek.setRange(0, len(seq) - 1)
+            self.new_seek.setRange(0, total - 1)
             self.new_seek.setEnabled(True)
             self.start_created()
 
@@ -964,16 +1252,26 @@ class BootAnimWidget(QWidget):
 
         is_gif = sel.lower().endswith(".gif")
         ffmpeg_path_field = self.ffmpeg_edit.text().strip() or self.ffmpeg_resolved_path or ""
-        if not is_gif and not ffmpeg_path_field and not shutil.which("ffmpeg"):
+        if not is_gif and not ffmpeg_path_field and not _which_ffmpeg():
             QMessageBox.critical(self, "FFmpeg missing", "FFmpeg not configured in the FFmpeg field and not found in PATH. Set it before previewing videos.")
             return
 
         self.log(f"[INFO] Extracting frames for preview: {sel} @ {w}x{h} @{fps}fps")
         if is_gif:
-            t = FuncThread(extract_gif_frames_sync, sel, w, h, fps)
+            t = FuncThread(extract_gif_frames_sync, sel, w, h, fps, quality="fast")
         else:
-            t = FuncThread(extract_video_frames_sync, sel, w, h, ffmpeg_path_field, fps)
+            # videos are piped straight into memory; frames never hit the work dir
+            t = FuncThread(decode_video_frames_sync, sel, w, h, ffmpeg_path_field, fps,
+                           self.new_label.width(), self.new_label.height())
+            t._preview_src = sel
+            t._preview_fps = fps
+            t.done.connect(self._on_video_decode_done)
+            self._start_thread(t)
+            self.log("[INFO] Decode thread started...")
+            return
         t._preview_src = sel
+        t._preview_quality = "fast" if is_gif else "best"
+        t._preview_params = (w, h, fps)
         t.done.connect(self._on_preview_extraction_done)
         self._start_thread(t)
         self.log("[INFO] Extraction thread started...")
@@ -993,11 +1291,37 @@ class BootAnimWidget(QWidget):
             except Exception as e:
                 self.log(f"[WARN] Failed deleting old temp frames: {e}")
         self._last_created_frames_dir = frames_dir
+        t = self.sender()
+        self._created_frames_src = getattr(t, "_preview_src", None)
+        self._created_frames_quality = getattr(t, "_preview_quality", "best")
+        self._created_frames_params = getattr(t, "_preview_params", None)
 
-        # Build sequence from the flat frames (loads QPixmaps into RAM)
+        # Build sequence from the flat frames (loads QImages into RAM)
         # _on_loader_done will start playback when done
         self.build_sequence_from_flat_frames(frames_dir, which="created")
 
+    def _on_video_decode_done(self, result, error):
+        if error:
+            self.log(f"[ERROR] Extraction failed: {error}")
+            QMessageBox.critical(self, "Extraction failed", str(error))
+            return
+        previews, pngs, starts, total = result
+        if not previews:
+            self.log("[WARN] ffmpeg produced no frames.")
+            QMessageBox.information(self, "Preview", "No frames were decoded from the video. See log for details.")
+            return
+        # any frames dir from an earlier preview is now stale
+        if self._last_created_frames_dir and os.path.isdir(self._last_created_frames_dir):
+            shutil.rmtree(self._last_created_frames_dir, ignore_errors=True)
+        self._last_created_frames_dir = None
+        t = self.sender()
+        self._created_frames_src = getattr(t, "_preview_src", None)
+        self._created_frames_quality = "best"
+        fps = getattr(t, "_preview_fps", 30)
+        self.log(f"[INFO] Decoded {total} frames in memory ({len(previews)} unique).")
+        names = [f"{s + 1:09d}.png" for s in starts]
+        self._apply_sequence("created", previews, names, pngs, starts, total, int(1000 / max(1, fps)))
+
     def build_sequence_from_flat_frames(self, frames_dir: str, which: str = "created"):
         if not os.path.isdir(frames_dir):
             self.log(f"[ERROR] Frames folder missing: {frames_dir}")
@@ -1035,49 +1359,86 @@ class BootAnimWidget(QWidget):
             fn += ".zip"
         self.created_zip_path = fn
 
-        tmp_build = tempfile.mkdtemp(prefix="qadb_build_")
-        try:
-            part0 = os.path.join(tmp_build, "part0")
-            os.makedirs(part0, exist_ok=True)
+        frames_dir = self._detect_created_frames_dir()
+        if frames_dir and self._created_frames_quality == "fast" and self._created_frames_src and self._created_frames_params:
+            # preview frames were resized with the fast filter; re-extract at full quality (same size as the
+            # preview, whatever the spin boxes say now) in the background, then write the zip
+            self.log("[INFO] Re-extracting GIF frames at full quality for output...")
+            w, h, fps = self._created_frames_params
+            t = FuncThread(extract_gif_frames_sync, self._created_frames_src, w, h, fps, quality="best")
+            t.done.connect(self._on_best_frames_done)
+            self.create_zip_btn.setEnabled(False)
+            self._start_thread(t)
+            return
+        self._write_created_zip()
 
+    def _on_best_frames_done(self, result, error):
+        self.create_zip_btn.setEnabled(True)
+        if error:
+            self.log(f"[ERROR] Full-quality extraction failed: {error}")
+            QMessageBox.critical(self, "Create failed", str(error))
+            return
+        if self._last_created_frames_dir and os.path.isdir(self._last_created_frames_dir):
+            shutil.rmtree(self._last_created_frames_dir, ignore_errors=True)
+        self._last_created_frames_dir = result
+        self._created_frames_quality = "best"
+        self._write_created_zip()
+
+    def _write_created_zip(self):
+        """Write self.created_zip_path from the frames directory if present, else from seq_created."""
+        # (name, bytes) for every frame; the zip is assembled entirely in memory, no staging directory
+        frame_entries: List[Tuple[str, bytes]] = []
+        try:
             # If we have an on-disk frames_dir, prefer that
             frames_dir = self._detect_created_frames_dir()
             if frames_dir and os.path.isdir(frames_dir):
-                files = [f for f in os.listdir(frames_dir) if f.lower().endswith((".png", ".jpg", ".jpeg", ".webp", ".bmp"))]
+                with os.scandir(frames_dir) as it:
+                    files = [e.name for e in it if e.is_file() and e.name.lower().endswith(IMG_EXTS)]
                 if not files:
                     QMessageBox.warning(self, "No frames", "No image frames found in selected frames directory.")
                     return
                 files.sort(key=_frame_sort_key)
                 for i, fname in enumerate(files):
                     src = os.path.join(frames_dir, fname)
-                    dstname = f"{i:05d}.png"
-                    dst = os.path.join(part0, dstname)
+                    data = _read_file_bytes(src)
                     if not fname.lower().endswith(".png"):
                         try:
-                            im = Image.open(src).convert("RGBA")
-                            im.save(dst, format="PNG")
+                            buf = io.BytesIO()
+                            Image.open(io.BytesIO(data)).convert("RGBA").save(buf, format="PNG")
+                            data = buf.getvalue()
                         except Exception as e:
                             self.log(f"[WARN] Failed convert {src}: {e}")
-                            shutil.copy2(src, dst)
-                    else:
-                        shutil.copy2(src, dst)
+                    frame_entries.append((f"part0/{i:05d}.png", data))
             else:
-                # Build from seq_created in memory (pixmaps)
+                # Build from seq_created in memory (preview images)
                 if not getattr(self, "seq_created", None):
                     QMessageBox.warning(self, "No frames", "No created frames in memory. Use 'Preview' first.")
                     return
-                for i, (pix, _, _) in enumerate(self.seq_created):
-                    dst = os.path.join(part0, f"{i:05d}.png")
+                # desc.txt has no per-frame duration, so held frames are written out once per frame again
+                ends = self.starts_created[1:] + [self.frames_total_created]
+
+                def png_for(u: int):
+                    raw = self._seq_created_bytes[u] if u < len(self._seq_created_bytes) else None
+                    if raw is not None and self.names_created[u].lower().endswith(".png"):
+                        # already PNG: reuse the decoded-from bytes instead of re-encoding the image
+                        return raw
                     try:
-                        # QPixmap.save accepts PNG path
-                        saved = pix.save(dst, "PNG")
-                        if not saved:
-                            raise RuntimeError("QPixmap.save returned False")
+                        return _encode_png(self.seq_created[u])
                     except Exception as e:
+                        return e
+
+                # re-encodes are independent zlib passes that release the GIL; map keeps frame order
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    results = list(pool.map(png_for, range(len(self.seq_created))))
+                for u, data in enumerate(results):
+                    run = range(self.starts_created[u], ends[u])
+                    if isinstance(data, Exception):
                         # fallback: create a small blank PNG to preserve ordering
-                        self.log(f"[WARN] Failed saving frame {i}: {e}")
-                        im = Image.new("RGBA", (self.width_spin.value(), self.height_spin.value()), (0, 0, 0, 0))
-                        im.save(dst, "PNG")
+                        self.log(f"[WARN] Failed saving frame {run.start}: {data}")
+                        buf = io.BytesIO()
+                        Image.new("RGBA", (self.width_spin.value(), self.height_spin.value()), (0, 0, 0, 0)).save(buf, "PNG")
+                        data = buf.getvalue()
+                    frame_entries.extend((f"part0/{i:05d}.png", data) for i in run)
 
             # write desc.txt based on current width/height/fps
             try:
@@ -1087,29 +1448,22 @@ class BootAnimWidget(QWidget):
             except Exception:
                 w, h, fps = 720, 240, 30
             desc = f"{w} {h} {fps}\n" + "p 1 0 part0\n"
-            with open(os.path.join(tmp_build, "desc.txt"), "w", encoding="utf-8", newline='\n') as f:
-                f.write(desc)
 
             # create zip
             zip_out = self.created_zip_path
             os.makedirs(os.path.dirname(zip_out) or ".", exist_ok=True)
+            # must stay STORED: Android's loader expects uncompressed entries and PNGs don't deflate further anyway
             with zipfile.ZipFile(zip_out, "w", compression=zipfile.ZIP_STORED) as zf:
-                for rootp, dirs, files2 in os.walk(tmp_build):
-                    for fnm in files2:
-                        full = os.path.join(rootp, fnm)
-                        rel = os.path.relpath(full, tmp_build)
-                        zf.write(full, rel)
+                # whole-buffer writestr lets zipfile CRC each entry in one zlib.crc32 call
+                zf.writestr("desc.txt", desc.encode("utf-8"))
+                for name, data in frame_entries:
+                    zf.writestr(name, data)
             self.created_zip_path = zip_out
             self.log(f"[INFO] Created bootanimation.zip: {zip_out}")
             QMessageBox.information(self, "Created", f"Created: {zip_out}")
         except Exception as e:
             self.log(f"[ERROR] Create failed: {e}")
             QMessageBox.critical(self, "Create failed", str(e))
-        finally:
-            try:
-                shutil.rmtree(tmp_build)
-            except Exception:
-                pass
 
     def push_zip_flow(self):
         """
@@ -1174,39 +1528,39 @@ class BootAnimWidget(QWidget):
 
         tmp_remote = "/data/local/tmp/quickadb_push_bootanim.zip"
         logs.append(f"[PUSH] Pushing {local_zip} -> {tmp_remote} via adb push")
-        push = subprocess.run([adb_cmd, "push", local_zip, tmp_remote], capture_output=True, text=True, timeout=300, creationflags=creationflags)
+        # adb push progress goes to one merged pipe; only the tail is ever logged
+        push = subprocess.run([adb_cmd, "push", local_zip, tmp_remote], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, timeout=300, creationflags=creationflags)
         logs.append(f"[PUSH] adb push rc={push.returncode}")
         self._log_proc(logs, push, "push")
         if push.returncode != 0:
             raise RuntimeError("\n".join(logs + ["adb push failed"]))
-        # attempt copy using root
-        cp_cmd = f'su -c cp "{tmp_remote}" "{remote_path}" && su -c chmod 0644 "{remote_path}"'
+        # copy + chmod + cleanup run as one root script, so the happy path costs a single adb shell round-trip
+        copy_script = f'cp "{tmp_remote}" "{remote_path}" && chmod 0644 "{remote_path}"'
         logs.append(f"[PUSH] Attempting root copy to {remote_path}")
-        proc = subprocess.run([adb_cmd, "shell", cp_cmd], shell=False, capture_output=True, text=True, timeout=60, creationflags=creationflags)
+        # exit with the copy's rc so a failed cleanup can't send a good install into the retry path;
+        # the temp file is only removed after a successful copy because the retry copies from it
+        first_script = f'{copy_script}; rc=$?; [ $rc -eq 0 ] && rm -f "{tmp_remote}"; exit $rc'
+        proc = subprocess.run([adb_cmd, "shell", "su -c " + shlex.quote(first_script)],
+                              capture_output=True, text=True, timeout=60, creationflags=creationflags)
         logs.append(f"[PUSH] root copy rc={proc.returncode}")
         self._log_proc(logs, proc, "root copy")
-        # if success
         if proc.returncode == 0:
-            # cleanup tmp remote
-            subprocess.run([adb_cmd, "shell", "su", "-c", f'rm "{tmp_remote}"'], capture_output=True, creationflags=creationflags)
             logs.append(f"[PUSH] Installed to {remote_path} (root copy succeeded)")
             return "\n".join(logs)
-        # try remount RW then copy
+        # remount RW, retry the copy and always clean up, again in one round-trip; the script exits with the copy's rc
         logs.append("[PUSH] Root copy failed; attempting remount and retry")
-        remount_cmd = [adb_cmd, "shell", "su", "-c", 'mount -o remount,rw /system || mount -o remount,rw /system_root || true']
-        rem = subprocess.run(remount_cmd, capture_output=True, text=True, timeout=20, creationflags=creationflags)
-        logs.append(f"[PUSH] remount rc={rem.returncode}")
-        self._log_proc(logs, rem, "remount")
-        # retry copy
-        proc2 = subprocess.run([adb_cmd, "shell", cp_cmd], shell=False, capture_output=True, text=True, timeout=60, creationflags=creationflags)
-        logs.append(f"[PUSH] retry root copy rc={proc2.returncode}")
+        retry_script = (
+            'mount -o remount,rw /system || mount -o remount,rw /system_root || true; '
+            f'{copy_script}; rc=$?; rm -f "{tmp_remote}"; exit $rc'
+        )
+        proc2 = subprocess.run([adb_cmd, "shell", "su -c " + shlex.quote(retry_script)],
+                               capture_output=True, text=True, timeout=80, creationflags=creationflags)
+        logs.append(f"[PUSH] remount + retry root copy rc={proc2.returncode}")
         self._log_proc(logs, proc2, "retry")
         if proc2.returncode == 0:
-            subprocess.run([adb_cmd, "shell", "su", "-c", f'rm "{tmp_remote}"'], capture_output=True, creationflags=creationflags)
             logs.append(f"[PUSH] Installed to {remote_path} after remount")
             return "\n".join(logs)
-        # final cleanup and error
-        subprocess.run([adb_cmd, "shell", "su", "-c", f'rm "{tmp_remote}"'], capture_output=True, creationflags=creationflags)
         logs.append("[PUSH] All methods failed to copy to target.")
         raise RuntimeError("\n".join(logs))
 
@@ -1267,10 +1621,14 @@ class BootAnimWidget(QWidget):
         if which == "current":
             return dict(
                 seq=self.seq_current,
+                names=self.names_current,
+                starts=self.starts_current,
+                total=self.frames_total_current,
                 playing=self.playing_current,
                 play_index="play_index_current",
                 frame_ms=getattr(self, "frame_ms_current", 33),
-                start_time="start_time_current",
+                next_at="next_frame_at_current",
+                shown="shown_current",
                 label=self.cur_label,
                 meta=self.cur_meta,
                 seek=self.cur_seek,
@@ -1279,10 +1637,14 @@ class BootAnimWidget(QWidget):
             )
         return dict(
             seq=self.seq_created,
+            names=self.names_created,
+            starts=self.starts_created,
+            total=self.frames_total_created,
             playing=self.playing_created,
             play_index="play_index_created",
             frame_ms=getattr(self, "frame_ms_created", 33),
-            start_time="start_time_created",
+            next_at="next_frame_at_created",
+            shown="shown_created",
             label=self.new_label,
             meta=self.new_meta,
             seek=self.new_seek,
@@ -1294,19 +1656,18 @@ class BootAnimWidget(QWidget):
         a = self._attrs(which)
         if not a["seq"] or not a["playing"]:
             return
-        total = len(a["seq"])
+        total = a["total"]
         if total == 0:
             return
-        now_ms = int(time.time() * 1000)
-        start = getattr(self, a["start_time"], None)
-        if start is None:
+        due = getattr(self, a["next_at"], None)
+        if due is None:
             return
-        elapsed = now_ms - start
-        idx = int(elapsed / a["frame_ms"]) % total
-        cur_idx = getattr(self, a["play_index"])
-        if idx != cur_idx:
-            setattr(self, a["play_index"], idx)
-            self._update_preview(which)
+        # the timer fires once per frame; only skip extra frames if we fell a whole frame behind
+        frame_ms = a["frame_ms"]
+        skip = 1 + max(0, _now_ms() - due) // frame_ms
+        setattr(self, a["play_index"], (getattr(self, a["play_index"]) + skip) % total)
+        setattr(self, a["next_at"], due + skip * frame_ms)
+        self._update_preview(which)
 
     def _tick_current(self):
         self._tick("current")
@@ -1319,14 +1680,13 @@ class BootAnimWidget(QWidget):
         if not a["seq"]:
             self.log(f"No {which} sequence to play.")
             return
-        idx = getattr(self, a["play_index"])
         if which == "current":
             self.playing_current = True
         else:
             self.playing_created = True
         a["play_btn"].setText("⏸")
-        setattr(self, a["start_time"], int(time.time() * 1000) - (idx * a["frame_ms"]))
-        a["timer"].start(int(a["frame_ms"] / 2))
+        setattr(self, a["next_at"], _now_ms() + a["frame_ms"])
+        a["timer"].start(max(1, a["frame_ms"]))
         self._update_preview(which)
 
     def start_current(self):
@@ -1356,8 +1716,7 @@ class BootAnimWidget(QWidget):
             setattr(self, a["play_index"], value)
             self._update_preview(which)
             if a["playing"]:
-                idx = getattr(self, a["play_index"])
-                setattr(self, a["start_time"], int(time.time() * 1000) - (idx * a["frame_ms"]))
+                setattr(self, a["next_at"], _now_ms() + a["frame_ms"])
 
     def _update_preview(self, which: str):
         a = self._attrs(which)
@@ -1365,11 +1724,18 @@ class BootAnimWidget(QWidget):
         if not seq:
             return
         idx = getattr(self, a["play_index"])
-        pix, ms, fname = seq[idx]
-        a["label"].setPixmap(pix)
-        total_s = (len(seq) * ms) / 1000
+        ms = a["frame_ms"]
+        total = a["total"]
+        # frame index -> stored image: the last run starting at or before idx
+        u = bisect_right(a["starts"], idx) - 1
+        fname = a["names"][u]
+        if getattr(self, a["shown"]) is not seq[u]:
+            # pixmaps are GUI-thread only; converting the one decoded QImage on screen is cheap
+            a["label"].setPixmap(QPixmap.fromImage(seq[u]))
+            setattr(self, a["shown"], seq[u])
+        total_s = (total * ms) / 1000
         curr_s = (idx * ms) / 1000
-        a["meta"].setText(f"{fname} | {curr_s:.1f}s / {total_s:.1f}s | {idx + 1}/{len(seq)}")
+        a["meta"].setText(f"{fname} | {curr_s:.1f}s / {total_s:.1f}s | {idx + 1}/{total}")
         a["seek"].blockSignals(True)
         a["seek"].setValue(idx)
         a["seek"].blockSignals(False)
@@ -1420,6 +1786,15 @@ class BootAnimWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.seq_current = []
             self.seq_created = []
+            self._seq_created_bytes = []
+            self.names_current = []
+            self.names_created = []
+            self.starts_current = []
+            self.starts_created = []
+            self.frames_total_current = 0
+            self.frames_total_created = 0
+            self.shown_current = None
+            self.shown_created = None
             self.cur_label.clear(); self.cur_label.setText("Cleared")
             self.new_label.clear(); self.new_label.setText("Cleared")
             self.playing_current = False; self.playing_created = False
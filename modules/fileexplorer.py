@@ -9,8 +9,16 @@ import sys
 import os
 import subprocess
 import tempfile
-import base64
+import shutil
 import re
+import threading
+import time
+import functools
+import posixpath
+import shlex
+import tarfile
+from operator import itemgetter
+from datetime import datetime
 
 from util.apkapi import APKInstallOptions, install_remote_package
 from util.resource import get_root_dir, resource_path
@@ -27,23 +35,221 @@ from PyQt6.QtWidgets import (
     QPushButton, QHBoxLayout, QFrame, QMessageBox, QMenu, QInputDialog,
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QFileDialog,
     QPlainTextEdit, QToolBar, QStatusBar, QProgressDialog, QSizePolicy,
-    QCheckBox, QDialog, QGridLayout
+    QCheckBox, QDialog, QGridLayout, QSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt6.QtGui import QAction, QPixmap, QFont
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, QTimer, pyqtSignal, QSize
+from PyQt6.QtGui import QAction, QPixmap, QFont, QImageReader
+
+
+# one NUL-terminated record per entry: type, size, mtime epoch, mode string, name, symlink target
+_FIND_PRINTF = r"%y\t%s\t%T@\t%M\t%f\t%l\0"
+# sources per adb pull/push invocation: enough to amortize adb's setup, small enough that
+# several batches can run side by side on the transfer pool (and argv stays short on Windows)
+_MAX_BATCH_SOURCES = 16
+# text preview reads at most this many bytes of a file
+_PREVIEW_BYTES = 2 * 1024 * 1024
+# concurrent adb pull/push processes; more than a handful just contend for the same usb link
+_DEFAULT_TRANSFERS = 4
+# longest a single command may run on the shared adb shell before the shell is killed
+_SESSION_TIMEOUT = 30.0
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# chmod dialog probe: octal mode from 'stat -c %a', or the mode string of an 'ls -ld' line
+_OCTAL_RE = re.compile(r"\b([0-7]{3,4})\b")
+_PERM_RE = re.compile(r"^(?P<perm>[-drlxspsbtStT]{10,})", re.M)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+# parsed listings are reused for back/forward/up navigation within this window
+_LISTING_TTL = 5.0
+_LISTING_CACHE_MAX = 64
+# properties / chmod dialog queries are reused for this long (cleared by any explicit refresh)
+_STAT_TTL = 5.0
+# shared/external storage (sdcardfs/FUSE), where chmod is usually accepted but ignored
+_EMULATED_PREFIXES = ("/sdcard", "/storage/")
+# row tuple: (name, type, size_str, date_str, size_bytes, is_folder, symlink_target, mtime_epoch, perms)
+# perms is the symbolic mode from the listing (e.g. '-rw-r--r--'), or '' if unknown
+# sort combo index -> row key (name, type, size in bytes, mtime); ties fall back to the case-insensitive name
+_SORT_KEYS = (
+    itemgetter(0),
+    lambda r: (r[1], r[0].lower()),
+    lambda r: (r[4], r[0].lower()),
+    lambda r: (r[7], r[0].lower()),
+)
+# the 'data' extraction filter (3.12+, backported to security releases) rejects unsafe members; skip those, keep going
+_TAR_EXTRACT_KW = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+_TAR_SKIPPABLE = (getattr(tarfile, "FilterError", OSError), OSError)
+
+
+def _ls_mtime(modified):
+    """Epoch seconds for an 'ls -la' date column, 0.0 when it can't be parsed."""
+    try:
+        if _ISO_DATE_RE.match(modified.split(" ", 1)[0]):
+            return datetime.strptime(modified[:16], "%Y-%m-%d %H:%M").timestamp()
+        if ":" not in modified:
+            return datetime.strptime(modified, "%b %d %Y").timestamp()
+        # "Mon DD HH:MM" is within the last six months; ls omits the year
+        now = datetime.now()
+        stamp = datetime.strptime(f"{modified} {now.year}", "%b %d %H:%M %Y")
+        if stamp > now:
+            stamp = stamp.replace(year=now.year - 1)
+        return stamp.timestamp()
+    except (ValueError, OverflowError, OSError):
+        return 0.0
+
+
+def _mode_from_perms(perms):
+    """'-rw-r--r--' -> '644'; None for links, setuid/sticky bits or anything else a plain rwx triple can't express."""
+    bits = perms[1:]
+    if len(perms) != 10 or perms[0] == "l" or not set(bits) <= set("rwx-"):
+        return None
+    return "".join(str((t[0] == "r") * 4 + (t[1] == "w") * 2 + (t[2] == "x")) for t in (bits[0:3], bits[3:6], bits[6:9]))
+
+
+def _file_ext(name):
+    """Lowercased extension after the last dot, '' when there is none."""
+    _, dot, ext = name.rpartition(".")
+    return ext.lower() if dot else ""
+
+
+@functools.lru_cache(maxsize=256)
+def _type_for_ext(ext):
+    return ext.upper() if ext else "File"
+
+
+class ShellSession:
+    """One long-lived 'adb shell' process; commands run one at a time and end at a sentinel line."""
+    SENTINEL = "__QADB_END__"
+    _SENTINEL_RE = re.compile(r"^__QADB_END__(\d+)$")
+
+    def __init__(self, adb_path):
+        self.adb_path = adb_path
+        self._proc = None
+        self._serial = None
+        self._lock = threading.Lock()
+
+    def _ensure_proc(self):
+        serial = DeviceManager.instance().serial_args()
+        if self._proc and self._proc.poll() is None and serial == self._serial:
+            return self._proc
+        self._close_proc()
+        creationflags = 0
+        if os.name == 'nt':
+            creationflags = (
+                subprocess.CREATE_NEW_PROCESS_GROUP |
+                subprocess.CREATE_NO_WINDOW
+            )
+        self._proc = subprocess.Popen(
+            [self.adb_path] + serial + ['shell'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            # file names are arbitrary bytes; a strict decode error would leave the rest of a reply in the pipe
+            encoding="utf-8",
+            errors="replace",
+            bufsize=-1,
+            creationflags=creationflags
+        )
+        self._serial = serial
+        return self._proc
+
+    def run(self, cmdline, timeout=_SESSION_TIMEOUT):
+        """Run cmdline on the device and return (output, exit_code). Restarts the shell if it died.
 
+        A command that hasn't finished after timeout seconds kills the shell, so a stalled device
+        can't hold the session lock forever; the next command starts a fresh one.
+        """
+        with self._lock:
+            proc = self._ensure_proc()
+            watchdog = threading.Timer(timeout, proc.kill)
+            watchdog.daemon = True
+            lines = []
+            try:
+                # subshell keeps cd/exit/variables from leaking into the session; stdin must not eat our next command
+                proc.stdin.write(f"( {cmdline}\n) </dev/null 2>&1\nprintf '\\n{self.SENTINEL}%d\\n' $?\n")
+                proc.stdin.flush()
+                watchdog.start()
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        if not watchdog.is_alive():
+                            raise RuntimeError(f"adb shell command timed out after {timeout:.0f}s")
+                        raise RuntimeError("".join(lines).strip() or "adb shell session ended unexpectedly")
+                    m = self._SENTINEL_RE.match(line.rstrip("\n"))
+                    if m:
+                        # drop the newline printed in front of the sentinel
+                        output = "".join(lines)
+                        return output[:-1] if output.endswith("\n") else output, int(m.group(1))
+                    lines.append(line)
+            except BaseException:
+                # whatever broke the read, the rest of this reply is still in the pipe; never reuse that shell
+                self._close_proc()
+                raise
+            finally:
+                watchdog.cancel()
+
+    def _close_proc(self):
+        proc, self._proc = self._proc, None
+        if not proc:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(1)
+        except Exception:
+            proc.kill()
+
+    def close(self):
+        # no lock: a command in flight must not hold up shutdown; killing the shell ends its read with EOF
+        proc = self._proc
+        if proc and proc.poll() is None:
+            proc.kill()
+
+
+class PoolJob(QRunnable):
+    """Base for work queued on the explorer's QThreadPool.
+
+    QRunnable can't emit signals, so each job carries a Signals QObject and exposes its signals as attributes.
+    Subclasses implement run_job() and keep any child process in self.proc so it can be cancelled.
+    """
+    class Signals(QObject):
+        finished = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.signals = self.Signals()
+        self.finished = self.signals.finished
+        self.proc = None
+
+    def run(self):
+        try:
+            self.run_job()
+        finally:
+            self.finished.emit()
 
-class ADBThread(QThread):
+    def run_job(self):
+        raise NotImplementedError
+
+    def cancel(self):
+        proc = self.proc
+        if proc and proc.poll() is None:
+            proc.kill()
+
+
+class ADBJob(PoolJob):
     """Run simple adb shell/pull/push commands without blocking UI."""
-    command_finished = pyqtSignal(str, bool)  # (output, is_error)
+    class Signals(PoolJob.Signals):
+        command_finished = pyqtSignal(str, bool)  # (output, is_error)
 
-    def __init__(self, adb_path, args):
+    def __init__(self, adb_path, args, session=None):
         super().__init__()
+        self.command_finished = self.signals.command_finished
         self.adb_path = adb_path
         self.args = args  # list of args after the adb binary
+        self.session = session  # ShellSession for plain 'shell <cmd>' calls, avoids spawning adb
 
-    def run(self):
+    def run_job(self):
         try:
+            if self.session and len(self.args) == 2 and self.args[0] == 'shell':
+                output, rc = self.session.run(self.args[1])
+                self.command_finished.emit(output, rc != 0)
+                return
 
             full_command = [self.adb_path] + DeviceManager.instance().serial_args() + self.args
 
@@ -54,31 +260,150 @@ class ADBThread(QThread):
                     subprocess.CREATE_NO_WINDOW
                 )
 
-            output = subprocess.check_output(full_command, text=True, stderr=subprocess.STDOUT, creationflags=creationflags)
-            self.command_finished.emit(output, False)
-        except subprocess.CalledProcessError as e:
-            out = ""
-            try:
-                out = e.output
-            except Exception:
-                out = str(e)
-            self.command_finished.emit(out or str(e), True)
+            self.proc = subprocess.Popen(full_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                         creationflags=creationflags)
+            output, _ = self.proc.communicate()
+            if self.proc.returncode != 0:
+                self.command_finished.emit(output or f"adb exited with code {self.proc.returncode}", True)
+            else:
+                self.command_finished.emit(output, False)
         except Exception as e:
             self.command_finished.emit(str(e), True)
 
 
-class RemoteAPKInstallThread(QThread):
-    """Install an APK that already exists on the device filesystem."""
+class PreviewJob(PoolJob):
+    """Read the head of a device file as raw bytes through 'adb exec-out'."""
+    class Signals(PoolJob.Signals):
+        preview_finished = pyqtSignal(str, bool, bool)  # (text, is_error, truncated)
+
+    def __init__(self, adb_path, shell_cmd, limit):
+        super().__init__()
+        self.preview_finished = self.signals.preview_finished
+        self.adb_path = adb_path
+        self.shell_cmd = shell_cmd  # must print at most limit + 1 bytes so truncation is detectable
+        self.limit = limit
+
+    def run_job(self):
+        try:
+            full_command = [self.adb_path] + DeviceManager.instance().serial_args() + ['exec-out', self.shell_cmd]
+            creationflags = 0
+            if os.name == 'nt':
+                creationflags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+            self.proc = subprocess.Popen(full_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                         creationflags=creationflags)
+            data, err = self.proc.communicate()
+            if self.proc.returncode != 0 or (err and not data):
+                message = (err or data).decode("utf-8", errors="replace").strip()
+                self.preview_finished.emit(message or f"adb exited with code {self.proc.returncode}", True, False)
+                return
+            truncated = len(data) > self.limit
+            # decode once; a multibyte char cut at the limit just becomes U+FFFD
+            self.preview_finished.emit(data[:self.limit].decode("utf-8", errors="replace"), False, truncated)
+        except Exception as e:
+            self.preview_finished.emit(str(e), True, False)
+
+
+class ExecOutFileJob(PoolJob):
+    """Stream the stdout of an 'adb exec-out' command straight into a local file."""
+    class Signals(PoolJob.Signals):
+        transfer_finished = pyqtSignal(str, bool, str)  # (output, is_error, dest_path)
+
+    def __init__(self, adb_path, shell_cmd, dest_path):
+        super().__init__()
+        self.transfer_finished = self.signals.transfer_finished
+        self.adb_path = adb_path
+        self.shell_cmd = shell_cmd
+        self.dest_path = dest_path
+
+    def run_job(self):
+        try:
+            full_command = [self.adb_path] + DeviceManager.instance().serial_args() + ['exec-out', self.shell_cmd]
+            creationflags = 0
+            if os.name == 'nt':
+                creationflags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+            with open(self.dest_path, "wb") as out:
+                self.proc = subprocess.Popen(full_command, stdout=out, stderr=subprocess.PIPE,
+                                             creationflags=creationflags)
+                _, err = self.proc.communicate()
+            message = err.decode("utf-8", errors="replace").strip()
+            if self.proc.returncode != 0 or not os.path.getsize(self.dest_path):
+                self.transfer_finished.emit(message or f"adb exited with code {self.proc.returncode}", True, self.dest_path)
+            else:
+                self.transfer_finished.emit(message, False, self.dest_path)
+        except Exception as e:
+            self.transfer_finished.emit(str(e), True, self.dest_path)
+
+
+class TarPullJob(PoolJob):
+    """Pull a device tree as one 'adb exec-out tar c' stream and unpack it locally as it arrives.
 
-    install_finished = pyqtSignal(object)
-    install_failed = pyqtSignal(str)
+    adb pull does a sync round-trip per file; the tar stream has none, which matters for trees with many small files.
+    """
+    class Signals(PoolJob.Signals):
+        transfer_finished = pyqtSignal(str, bool, str)  # (output, is_error, dest_dir)
+        transfer_progress = pyqtSignal(str)
+
+    def __init__(self, adb_path, shell_cmd, dest_dir, label):
+        super().__init__()
+        self.transfer_finished = self.signals.transfer_finished
+        self.transfer_progress = self.signals.transfer_progress
+        self.adb_path = adb_path
+        self.shell_cmd = shell_cmd  # must write the archive to stdout and nothing else
+        self.dest_dir = dest_dir
+        self.label = label
+        self.received = 0
+
+    def read(self, size=-1):
+        # tarfile reads through us, so we can count bytes without a second copy
+        data = self.proc.stdout.read(size)
+        before, self.received = self.received, self.received + len(data)
+        if before >> 20 != self.received >> 20:
+            self.transfer_progress.emit(f"{self.label}: {self.received / (1024 * 1024):.1f} MiB received")
+        return data
+
+    def run_job(self):
+        try:
+            full_command = [self.adb_path] + DeviceManager.instance().serial_args() + ['exec-out', self.shell_cmd]
+            creationflags = 0
+            if os.name == 'nt':
+                creationflags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+            self.proc = subprocess.Popen(full_command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                         creationflags=creationflags)
+            members = skipped = 0
+            with tarfile.open(fileobj=self, mode="r|", bufsize=1024 * 1024) as tar:
+                for member in tar:
+                    members += 1
+                    try:
+                        tar.extract(member, self.dest_dir, **_TAR_EXTRACT_KW)
+                    except _TAR_SKIPPABLE:
+                        skipped += 1
+            self.proc.stdout.close()
+            self.proc.wait()
+            if not members:
+                self.transfer_finished.emit("device sent an empty archive (unreadable path or no tar)", True, self.dest_dir)
+                return
+            message = f"{skipped} item(s) could not be extracted" if skipped else ""
+            self.transfer_finished.emit(message, False, self.dest_dir)
+        except Exception as e:
+            # exec-out does not forward the remote exit code; a tar that failed shows up as an empty or cut archive
+            self.cancel()
+            self.transfer_finished.emit(str(e) or "tar stream ended unexpectedly", True, self.dest_dir)
+
+
+class RemoteAPKInstallJob(PoolJob):
+    """Install an APK that already exists on the device filesystem."""
+    class Signals(PoolJob.Signals):
+        install_finished = pyqtSignal(object)
+        install_failed = pyqtSignal(str)
 
     def __init__(self, remote_path: str, use_root: bool):
         super().__init__()
+        self.install_finished = self.signals.install_finished
+        self.install_failed = self.signals.install_failed
         self.remote_path = remote_path
         self.use_root = use_root
 
-    def run(self):
+    def run_job(self):
         try:
             result = install_remote_package(
                 self.remote_path,
@@ -90,18 +415,21 @@ class RemoteAPKInstallThread(QThread):
             self.install_failed.emit(str(exc))
 
 
-class TransferRunner(QThread):
+class TransferRunner(PoolJob):
     """Run long-running adb pull/push in background so UI doesn't freeze."""
-    transfer_finished = pyqtSignal(str, bool, str)  # output, is_error, local_dest (or src)
-    transfer_progress = pyqtSignal(str)  # free-form progress line (not used for UI progress bar here)
+    class Signals(PoolJob.Signals):
+        transfer_finished = pyqtSignal(str, bool, str)  # output, is_error, local_dest (or src)
+        transfer_progress = pyqtSignal(str)  # free-form progress line (not used for UI progress bar here)
 
     def __init__(self, adb_path, args, cwd=None):
         super().__init__()
+        self.transfer_finished = self.signals.transfer_finished
+        self.transfer_progress = self.signals.transfer_progress
         self.adb_path = adb_path
         self.args = args
         self.cwd = cwd or os.getcwd()
 
-    def run(self):
+    def run_job(self):
         try:
 
             cmd = [self.adb_path] + DeviceManager.instance().serial_args() + self.args
@@ -112,24 +440,33 @@ class TransferRunner(QThread):
                     subprocess.CREATE_NO_WINDOW
                 )
 
-            proc = subprocess.Popen(
+            proc = self.proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 cwd=self.cwd,
-                universal_newlines=True,
-                bufsize=1,
+                bufsize=-1,
                 creationflags=creationflags
             )
 
+            # read whatever is available in 64K blocks and split lines ourselves, instead of one read per line
+            fd = proc.stdout.fileno()
+            pending = b""
             last_line = ""
             while True:
-                line = proc.stdout.readline()
-                if not line and proc.poll() is not None:
+                chunk = os.read(fd, 65536)
+                if not chunk:
                     break
-                if line:
-                    last_line = line.rstrip("\n")
-                    self.transfer_progress.emit(last_line)
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    # a bare \r separates in-place progress updates
+                    for part in line.rstrip(b"\r").split(b"\r"):
+                        last_line = part.decode("utf-8", "replace")
+                        self.transfer_progress.emit(last_line)
+            if pending:
+                last_line = pending.rstrip(b"\r").rsplit(b"\r", 1)[-1].decode("utf-8", "replace")
+                self.transfer_progress.emit(last_line)
 
             ret = proc.wait()
             if ret == 0:
@@ -143,8 +480,8 @@ class TransferRunner(QThread):
 
 class ADBFileExplorer(QMainWindow):
 
-    VIEWABLE_TEXT_EXTENSIONS = ("txt", "log", "json", "xml", "html", "csv", "md", "ini", "conf", "prop", "sh", "bat", "py", "js", "css", "cpp", "h", "hpp", "c", "rc", "")
-    VIEWABLE_IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "bmp")
+    VIEWABLE_TEXT_EXTENSIONS = frozenset(("txt", "log", "json", "xml", "html", "csv", "md", "ini", "conf", "prop", "sh", "bat", "py", "js", "css", "cpp", "h", "hpp", "c", "rc", ""))
+    VIEWABLE_IMAGE_EXTENSIONS = frozenset(("png", "jpg", "jpeg", "gif", "bmp"))
 
     def __init__(self):
         super().__init__()
@@ -159,8 +496,33 @@ class ADBFileExplorer(QMainWindow):
         self.forward_stack = []
         self.selected_items = []
         self.copy_mode = False
-        self.threads = []
         self.symlink_targets = {}
+        # created by init_toolbar; None until then so is_root needs no hasattr probe
+        self.root_access_checkbox = None
+        # (path, root) -> (monotonic time, rows, permission_issue)
+        self._ls_cache = {}
+        # (path, shell command) -> (monotonic time, output) for properties / chmod queries
+        self._stat_cache = {}
+        # rows of the directory on screen; sorting reorders this list and refills the table
+        self._rows = []
+        # search state: lowercased names per table row, which rows are hidden, and the last query
+        self._lower_names = []
+        self._hidden = []
+        self._last_search = ""
+        # last time a transfer progress line reached the status bar
+        self._last_status_ts = 0.0
+        self._pending_refresh = False
+        # every adb command runs as a pooled job; the set keeps in-flight jobs reachable for cancellation
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 2))
+        # transfers get their own pool so a long pull queue never starves listings and shell jobs
+        self.transfer_pool = QThreadPool(self)
+        self.transfer_pool.setMaxThreadCount(_DEFAULT_TRANSFERS)
+        self._jobs = set()
+        # scratch files for previews; the whole directory is removed on close
+        self._temp_root = tempfile.mkdtemp(prefix="qadb_explorer_")
+        # listings, text previews and cleanups share one adb shell instead of spawning adb each time
+        self.shell = ShellSession(self.adb_path)
 
         self.init_ui()
         ThemeManager.apply_theme(self)
@@ -169,31 +531,40 @@ class ADBFileExplorer(QMainWindow):
     @property
     def is_root(self):
         """Returns True if the root access checkbox is checked."""
-        return hasattr(self, 'root_access_checkbox') and self.root_access_checkbox.isChecked()
+        return self.root_access_checkbox is not None and self.root_access_checkbox.isChecked()
 
     # -----------------------------
     # Thread Management
     # -----------------------------
-    def _start_thread(self, thread):
-        """Starts a QThread and connects it to the cleanup slot."""
-        thread.finished.connect(lambda: self._on_thread_finished(thread))
-        self.threads.append(thread)
-        thread.start()
-
-    def _on_thread_finished(self, thread):
-        """Removes a thread from the tracking list once it's finished."""
-        try:
-            self.threads.remove(thread)
-        except ValueError:
-            pass
+    def _start_thread(self, job):
+        """Queues a PoolJob on the explorer's thread pool (transfers on the capped transfer pool)."""
+        job.finished.connect(lambda: self._jobs.discard(job))
+        self._jobs.add(job)
+        pool = self.transfer_pool if isinstance(job, (TransferRunner, TarPullJob)) else self.pool
+        pool.start(job)
+
+    def _shell(self, cmd, on_done=None, session=False):
+        """Queue 'adb shell cmd' and connect on_done(output, is_error).
+
+        session=True runs it on the shared ShellSession (quick commands only: it is serialized
+        with directory listings); otherwise it gets its own adb process. su commands always get
+        their own process, since su may sit on a grant prompt.
+        """
+        if cmd.startswith("su "):
+            session = False
+        job = ADBJob(self.adb_path, ['shell', cmd], session=self.shell if session else None)
+        if on_done is not None:
+            job.command_finished.connect(on_done)
+        self._start_thread(job)
+        return job
 
     def _root_cmd(self, cmd: str) -> str:
-        """Wrap cmd in su -c '...' when root access is active."""
-        return f"su -c \"{cmd}\"" if self.is_root else cmd
+        """Wrap cmd in su -c '...' when root access is active.
 
-    def _dpath(self, *parts) -> str:
-        """Join path parts and normalize to forward-slash device path."""
-        return os.path.join(*parts).replace("\\", "/")
+        cmd is a plain shell command (paths quoted with shlex.quote); it is quoted once more as
+        a whole, so no manual escaping is needed for the su layer.
+        """
+        return f"su -c {shlex.quote(cmd)}" if self.is_root else cmd
 
     def _make_progress(self, label: str) -> QProgressDialog:
         """Create a modal indeterminate progress dialog."""
@@ -313,6 +684,15 @@ class ADBFileExplorer(QMainWindow):
         self.sort_combo.currentIndexChanged.connect(self._on_sort_combo_changed)
         toolbar.addWidget(self.sort_combo)
 
+        toolbar.addSeparator()
+        toolbar.addWidget(QLabel("Transfers:"))
+        self.transfer_spin = QSpinBox()
+        self.transfer_spin.setRange(1, 16)
+        self.transfer_spin.setValue(_DEFAULT_TRANSFERS)
+        self.transfer_spin.setToolTip("Maximum number of pulls/pushes running at once")
+        self.transfer_spin.valueChanged.connect(self.transfer_pool.setMaxThreadCount)
+        toolbar.addWidget(self.transfer_spin)
+
         spacer = QWidget()
         spacer.setObjectName("TBspacer")
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
@@ -339,7 +719,12 @@ class ADBFileExplorer(QMainWindow):
         self.search_field = QLineEdit()
         self.search_field.setObjectName("SearchBar")
         self.search_field.setPlaceholderText("Search in current directory...")
-        self.search_field.textChanged.connect(self.filter_table_by_search)
+        # coalesce a burst of keystrokes into one filter pass over the table
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(lambda: self.filter_table_by_search(self.search_field.text()))
+        self.search_field.textChanged.connect(self._search_timer.start)
         self.path_layout.addWidget(self.search_field)
 
     def init_file_view(self):
@@ -357,10 +742,20 @@ class ADBFileExplorer(QMainWindow):
         self.table.customContextMenuRequested.connect(self.open_context_menu)
         self.table.cellDoubleClicked.connect(self.handle_double_click)
         self.table.horizontalHeader().sectionClicked.connect(self.header_clicked)
+        self.table.horizontalHeader().setSortIndicatorShown(True)
+        # symlink tooltips are built on first hover instead of for every row
+        self.table.setMouseTracking(True)
+        self.table.itemEntered.connect(self._maybe_set_symlink_tooltip)
 
 
         self._sort_order = Qt.SortOrder.AscendingOrder
 
+    def _maybe_set_symlink_tooltip(self, item):
+        if item.column() == 0 and not item.toolTip():
+            target = self.symlink_targets.get(item.text())
+            if target:
+                item.setToolTip(f"Symlink to: {target}")
+
     # -----------------------------
     # Navigation / path operations
     # -----------------------------
@@ -381,7 +776,7 @@ class ADBFileExplorer(QMainWindow):
         self.current_path = new_path
         self.path_field.setText(self.current_path)
         self.back_button.setEnabled(bool(self.history_stack))
-        self.refresh_file_list()
+        self.refresh_file_list(use_cache=True)
 
     def change_path(self):
         """Navigates to the path entered in the path field."""
@@ -406,47 +801,154 @@ class ADBFileExplorer(QMainWindow):
         self.current_path = nxt
         self.path_field.setText(self.current_path)
         self.forward_button.setEnabled(bool(self.forward_stack))
-        self.refresh_file_list()
+        self.refresh_file_list(use_cache=True)
 
     def go_to_parent_directory(self):
         """Navigates up to the parent directory."""
-        self._navigate_to(os.path.dirname(self.current_path))
+        self._navigate_to(posixpath.dirname(self.current_path))
 
     # -----------------------------
     # Directory listing
     # -----------------------------
-    def refresh_file_list(self):
-        """Fetches and displays the file list for the current path."""
+    def _schedule_refresh(self):
+        """Refresh once shortly after a batch of operations, not once per finished job."""
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        QTimer.singleShot(250, self._do_refresh)
+
+    def _do_refresh(self):
+        self._pending_refresh = False
+        self.refresh_file_list()
+
+    def refresh_file_list(self, use_cache=False):
+        """Fetches and displays the file list for the current path.
+
+        use_cache=True (navigation) reuses a listing parsed less than _LISTING_TTL seconds ago;
+        explicit refreshes and refreshes after file operations always hit the device.
+        """
         self.search_field.clear()
         self.statusBar.showMessage("Loading directory contents...")
-        self.table.setRowCount(0)
-        self.symlink_targets.clear()
+        if not use_cache:
+            # explicit refreshes follow file operations, after which any cached stat may be stale
+            self._stat_cache.clear()
+        # the old rows stay until the new listing arrives (sort_table reuses their items), but locked:
+        # current_path already names the new directory, so acting on a stale row would hit the wrong path
+        self.table.clearSelection()
+        self.table.setEnabled(False)
+
+        key = (self.current_path, self.is_root)
+        cached = self._ls_cache.get(key)
+        if use_cache and cached and time.monotonic() - cached[0] < _LISTING_TTL:
+            self._show_rows(cached[1], cached[2])
+            return
 
+        # find -printf gives machine-readable records; older toybox builds without it fall back to ls -la
+        path = shlex.quote(self.current_path)
+        cmd = self._root_cmd(f"find -H {path} -mindepth 1 -maxdepth 1 -printf '{_FIND_PRINTF}' 2>/dev/null"
+                             f" || ls -la {path} 2>&1")
         if self.is_root:
-            cmd = ['shell', f'su -c "ls -la \\"{self.current_path}\\" 2>&1"']
             self.statusBar.showMessage("Loading directory contents with root access...")
-        else:
-            cmd = ['shell', f'ls -la "{self.current_path}" 2>&1']
 
+        self._shell(cmd, functools.partial(self.process_directory_listing, cache_key=key), session=True)
 
-        ls_thread = ADBThread(self.adb_path, cmd)
-        ls_thread.command_finished.connect(self.process_directory_listing)
-        self._start_thread(ls_thread)
+    def _cached_shell(self, path, cmd, callback, use_session=True):
+        """Run a read-only shell query about path, reusing a result from the last _STAT_TTL seconds."""
+        key = (path, cmd)
+        hit = self._stat_cache.get(key)
+        if hit and time.monotonic() - hit[0] < _STAT_TTL:
+            callback(hit[1], False)
+            return
+
+        def store(out, err):
+            if not err:
+                self._stat_cache[key] = (time.monotonic(), out)
+            callback(out, err)
+
+        self._shell(cmd, store, session=use_session)
+
+    def _invalidate_listing(self, path):
+        """Forget cached listings of path (root and non-root)."""
+        self._ls_cache.pop((path, False), None)
+        self._ls_cache.pop((path, True), None)
 
-    def process_directory_listing(self, output, error):
-        """Parses 'ls -la' output and populates the file table."""
+    def process_directory_listing(self, output, error, cache_key=None):
+        """Parses 'find -printf' (or fallback 'ls -la') output and populates the file table."""
+        if cache_key and cache_key != (self.current_path, self.is_root):
+            # a slower listing for a directory we already left
+            return
         if error and not output.strip():
+            self._rows = []
+            self.table.setRowCount(0)
+            self.table.setEnabled(True)
             QMessageBox.critical(self, "Error", output or "Unknown error listing directory")
             self.statusBar.showMessage("Error loading directory")
             return
 
-        permission_issue = False
         if error and output.strip():
             self.statusBar.showMessage("Directory loaded with some warnings")
 
-        self.table.setRowCount(0)
+        if "\0" in output:
+            rows, permission_issue = self._rows_from_find(output)
+        else:
+            rows, permission_issue = self._rows_from_ls(output)
+
+        if cache_key:
+            self._ls_cache.pop(cache_key, None)
+            self._ls_cache[cache_key] = (time.monotonic(), rows, permission_issue)
+            if len(self._ls_cache) > _LISTING_CACHE_MAX:
+                # dicts keep insertion order, so the first key is the oldest listing
+                self._ls_cache.pop(next(iter(self._ls_cache)))
+        self._show_rows(rows, permission_issue)
+
+    def _show_rows(self, rows, permission_issue):
+        """Show parsed rows in the current sort order."""
+        self._rows = rows
+        self.symlink_targets.clear()
+        for name, _, _, _, _, _, symlink_info, _, _ in rows:
+            if symlink_info:
+                self.symlink_targets[name] = symlink_info
+        self.sort_table()
+        self.table.setEnabled(True)
+
+        folder_count = sum(1 for r in rows if r[5])
+        file_count = len(rows) - folder_count
+        status_msg = f"Directory: {self.current_path} | {folder_count} folder(s), {file_count} file(s)"
+        if permission_issue:
+            status_msg += " (some items may be inaccessible)"
+        self.statusBar.showMessage(status_msg)
+
+    # -----------------------------
+    # Helpers: parsing and formatting
+    # -----------------------------
+    def _rows_from_find(self, output):
+        """Build table rows from NUL-terminated find -printf records."""
         rows = []
+        # anything after the last NUL is not a record (e.g. a partial listing followed by the ls fallback)
+        for rec in output.split("\0")[:-1]:
+            fields = rec.split("\t", 5)
+            if len(fields) != 6:
+                continue
+            ftype, size, mtime, perms, name, target = fields
+            if not name or name in (".", ".."):
+                continue
+            is_folder = ftype in ("d", "l")
+            try:
+                mtime_epoch = float(mtime)
+                date_str = datetime.fromtimestamp(mtime_epoch).strftime("%Y-%m-%d %H:%M")
+            except (ValueError, OverflowError, OSError):
+                mtime_epoch, date_str = 0.0, "-"
+            file_type = "Folder" if is_folder else self.detect_type(name)
+            size_str = "-" if is_folder else self.format_size_safe(size)
+            symlink_info = target if ftype == "l" else None
+            rows.append((name, file_type, size_str, date_str, self.safe_int(size), is_folder, symlink_info,
+                         mtime_epoch, perms))
+        return rows, False
 
+    def _rows_from_ls(self, output):
+        """Build table rows from 'ls -la' output."""
+        permission_issue = False
+        rows = []
         for line in output.splitlines():
             if not line.strip() or line.startswith("total"):
                 continue
@@ -482,40 +984,12 @@ class ADBFileExplorer(QMainWindow):
             file_type = "Folder" if is_folder else self.detect_type(name)
             size_str = "-" if is_folder else self.format_size_safe(size)
             symlink_info = target_path if is_symlink else None
-            rows.append((name, file_type, size_str, date_str, self.safe_int(size), is_folder, symlink_info))
+            rows.append((name, file_type, size_str, date_str, self.safe_int(size), is_folder, symlink_info,
+                         _ls_mtime(date_str), perms))
+        return rows, permission_issue
 
-        rows.sort(key=lambda x: (not x[5], x[0].lower()))
-
-        self.table.setSortingEnabled(False)
-
-        for name, file_type, size_str, date_str, _, is_folder, symlink_info in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            item = QTableWidgetItem(name)
-            if symlink_info:
-                self.symlink_targets[name] = symlink_info
-                item.setToolTip(f"Symlink to: {symlink_info}")
-            self.table.setItem(row, 0, item)
-            self.table.setItem(row, 1, QTableWidgetItem(file_type))
-            self.table.setItem(row, 2, QTableWidgetItem(size_str))
-            self.table.setItem(row, 3, QTableWidgetItem(date_str))
-
-        self.table.setSortingEnabled(True)
-
-        self.sort_table()
-
-        folder_count = sum(1 for r in rows if r[5])
-        file_count = len(rows) - folder_count
-        status_msg = f"Directory: {self.current_path} | {folder_count} folder(s), {file_count} file(s)"
-        if permission_issue:
-            status_msg += " (some items may be inaccessible)"
-        self.statusBar.showMessage(status_msg)
-
-    # -----------------------------
-    # Helpers: parsing and formatting
-    # -----------------------------
     def detect_type(self, name):
-        return name.split(".")[-1].upper() if "." in name else "File"
+        return _type_for_ext(_file_ext(name))
 
     def _parse_ls_entry(self, line):
         """Parse one 'ls -la' row.
@@ -525,7 +999,6 @@ class ADBFileExplorer(QMainWindow):
         Device nodes under paths like /dev use:
             perms links owner group major, minor date time... name
         """
-        import re
         text = (line or "").strip()
         if not text:
             return None
@@ -554,7 +1027,7 @@ class ADBFileExplorer(QMainWindow):
             return None
 
         # Check ISO mode
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", all_parts[date_idx]):
+        if _ISO_DATE_RE.match(all_parts[date_idx]):
             if len(all_parts) <= date_idx + 1:
                 return None
             modified = f"{all_parts[date_idx]} {all_parts[date_idx+1]}"
@@ -578,21 +1051,20 @@ class ADBFileExplorer(QMainWindow):
         }
 
     def safe_int(self, s):
+        # sizes come straight from find/ls, which never group digits
         try:
-            return int(s.replace(',', ''))
-        except (ValueError, AttributeError):
+            return int(s)
+        except (ValueError, TypeError):
             return 0
 
     def format_size_safe(self, size_bytes_str):
         try:
             size = int(size_bytes_str)
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024:
-                    return f"{size:.1f} {unit}"
-                size /= 1024
-            return f"{size:.1f} TB"
         except (ValueError, TypeError):
             return "-"
+        # each unit is 10 more bits, so the unit index falls out of the bit length
+        idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size > 0 else 0
+        return f"{size / (1 << (10 * idx)):.1f} {_SIZE_UNITS[idx]}"
 
     # -----------------------------
     # Interactions: double-click / context menu
@@ -615,11 +1087,10 @@ class ADBFileExplorer(QMainWindow):
             symlink_target = self.symlink_targets.get(selected_name)
             if symlink_target:
                 new_path = symlink_target if symlink_target.startswith('/') else \
-                    self._dpath(os.path.normpath(os.path.join(self.current_path, symlink_target)))
+                    posixpath.normpath(posixpath.join(self.current_path, symlink_target))
             else:
-                new_path = self._dpath(self.current_path, selected_name)
+                new_path = posixpath.join(self.current_path, selected_name)
 
-            new_path = new_path.replace("//", "/")
             if selected_name == "sdcard":
                 new_path = "/storage/emulated/0"
 
@@ -630,7 +1101,7 @@ class ADBFileExplorer(QMainWindow):
     def view_or_pull_file(self, filename):
         menu = QMenu()
         pull_action = menu.addAction("Pull File")
-        file_ext = filename.split(".")[-1].lower() if "." in filename else ""
+        file_ext = _file_ext(filename)
         viewable = file_ext in self.VIEWABLE_TEXT_EXTENSIONS
         image_ext = file_ext in self.VIEWABLE_IMAGE_EXTENSIONS
         view_action = menu.addAction("View Contents") if viewable or image_ext else None
@@ -647,52 +1118,30 @@ class ADBFileExplorer(QMainWindow):
     # Viewing files & images
     # -----------------------------
     def view_file_contents(self, filename, is_image=False):
-        full_path = self._dpath(self.current_path, filename)
+        full_path = posixpath.join(self.current_path, filename)
         if is_image:
-            temp_dir = os.path.join(tempfile.gettempdir(), "adbexplorer")
-            os.makedirs(temp_dir, exist_ok=True)
-            temp_path = os.path.join(temp_dir, filename)
+            fd, temp_path = tempfile.mkstemp(suffix=f".{_file_ext(filename)}", dir=self._temp_root)
+            os.close(fd)
             self.statusBar.showMessage(f"Pulling image {filename} for viewing...")
             if self.is_root:
-                device_temp = f"/data/local/tmp/{filename}"
-                dd_cmd = f'su -c "dd if=\\"{full_path}\\" of=\\"{device_temp}\\" && chmod 644 \\"{device_temp}\\""'
-
-                dd_thread = ADBThread(self.adb_path, ['shell', dd_cmd])
-                dd_thread.command_finished.connect(
-                    lambda out, err: self.pull_temp_image(out, err, filename, device_temp, temp_path)
-                )
-                self._start_thread(dd_thread)
+                # one exec-out round-trip; no device-side copy to chmod and delete afterwards
+                cat_cmd = self._root_cmd(f"cat {shlex.quote(full_path)} 2>/dev/null")
+                pull = ExecOutFileJob(self.adb_path, cat_cmd, temp_path)
+                pull.transfer_finished.connect(lambda out, err, dest: self.display_image(out, err, filename, dest))
+                self._start_thread(pull)
             else:
                 pull = TransferRunner(self.adb_path, ['pull', full_path, temp_path])
                 pull.transfer_finished.connect(lambda out, err, dest: self.display_image(out, err, filename, dest))
                 self._start_thread(pull)
         else:
             self.statusBar.showMessage(f"Loading contents of {filename}...")
-            shell_cmd = f'su -c "cat \\"{full_path}\\""' if self.is_root else f'cat "{full_path}"'
+            # exec-out is binary-clean (no pty CRLF translation); one extra byte tells us the file was cut
+            shell_cmd = self._root_cmd(f"head -c {_PREVIEW_BYTES + 1} {shlex.quote(full_path)}")
 
-            t = ADBThread(self.adb_path, ['shell', shell_cmd])
-            t.command_finished.connect(lambda out, err: self.display_file_contents(filename, out, err))
+            t = PreviewJob(self.adb_path, shell_cmd, _PREVIEW_BYTES)
+            t.preview_finished.connect(lambda out, err, cut: self.display_file_contents(filename, out, err, cut))
             self._start_thread(t)
 
-    def pull_temp_image(self, output, error, filename, device_temp, temp_path):
-        if error:
-            QMessageBox.critical(self, "Error", f"Could not copy image using root: {output}")
-            self.statusBar.showMessage("Error copying image with root")
-            return
-        pull = TransferRunner(self.adb_path, ['pull', device_temp, temp_path])
-        pull.transfer_finished.connect(lambda out, err, dest: self.finish_image_pull(out, err, filename, device_temp, dest))
-        self._start_thread(pull)
-
-    def finish_image_pull(self, output, error, filename, device_temp, temp_path):
-
-        cleanup = ADBThread(self.adb_path, ['shell', f'rm "{device_temp}"'])
-        self._start_thread(cleanup)
-        if error:
-            QMessageBox.critical(self, "Error", f"Could not pull temporary image: {output}")
-            self.statusBar.showMessage("Error pulling image")
-            return
-        self.display_image("", False, filename, temp_path)
-
     def display_image(self, output, error, filename, temp_path):
         if error:
             QMessageBox.critical(self, "Error", f"Could not pull image: {output}")
@@ -704,11 +1153,19 @@ class ADBFileExplorer(QMainWindow):
             dialog.setMinimumSize(800, 600)
             layout = QVBoxLayout(dialog)
             image_label = QLabel()
-            pixmap = QPixmap(temp_path)
-            original_w, original_h = pixmap.width(), pixmap.height()
-            if pixmap.width() > 780 or pixmap.height() > 580:
-                pixmap = pixmap.scaled(780, 580, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            image_label.setPixmap(pixmap)
+            # decode at display size; jpeg/png readers downscale while decoding instead of after
+            reader = QImageReader(temp_path)
+            size = reader.size()
+            original_w, original_h = size.width(), size.height()
+            if original_w > 780 or original_h > 580:
+                size.scale(780, 580, Qt.AspectRatioMode.KeepAspectRatio)
+                reader.setScaledSize(size)
+            image = reader.read()
+            if image.isNull():
+                raise ValueError(reader.errorString())
+            if original_w <= 0:
+                original_w, original_h = image.width(), image.height()
+            image_label.setPixmap(QPixmap.fromImage(image))
             image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(image_label)
             info_label = QLabel(f"Size: {original_w}x{original_h} | File: {filename}")
@@ -722,19 +1179,17 @@ class ADBFileExplorer(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not display image: {str(e)}")
             self.statusBar.showMessage("Error displaying image")
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
 
-    def display_file_contents(self, filename, content, error):
+    def display_file_contents(self, filename, content, error, truncated=False):
         if error:
             QMessageBox.critical(self, "Error", f"Could not read file: {content}")
             self.statusBar.showMessage("Error reading file")
             return
         dialog = QDialog(self)
-        dialog.setWindowTitle(f"Contents of {filename}")
+        title = f"Contents of {filename}"
+        if truncated:
+            title += f" (first {self.format_size_safe(_PREVIEW_BYTES)})"
+        dialog.setWindowTitle(title)
         dialog.setMinimumSize(800, 600)
         layout = QVBoxLayout(dialog)
         text_edit = QPlainTextEdit()
@@ -755,6 +1210,10 @@ class ADBFileExplorer(QMainWindow):
 
         save_device_button = QPushButton("Save to Device")
         save_device_button.clicked.connect(lambda: self.save_to_device(filename, text_edit.toPlainText()))
+        if truncated:
+            # writing back a partial preview would cut the file on the device
+            save_device_button.setEnabled(False)
+            save_device_button.setToolTip("File is larger than the preview; pull it to edit")
         button_layout.addWidget(save_device_button)
 
         close_button = QPushButton("Close")
@@ -777,7 +1236,7 @@ class ADBFileExplorer(QMainWindow):
             QMessageBox.critical(self, "Error", f"Could not save file: {str(e)}")
 
     def save_to_device(self, filename, content):
-        full_path = self._dpath(self.current_path, filename)
+        full_path = posixpath.join(self.current_path, filename)
         reply = QMessageBox.question(
             self, "Save to Device",
             f"Are you sure you want to save changes to {full_path} on the device?",
@@ -786,14 +1245,33 @@ class ADBFileExplorer(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        content_b64 = base64.b64encode(content.encode('utf-8')).decode('ascii')
         self.statusBar.showMessage(f"Saving {filename} to device...")
-        save_cmd = self._root_cmd(f'echo \'{content_b64}\' | base64 -d > \\"{full_path}\\"') \
-            if self.is_root else f'echo \'{content_b64}\' | base64 -d > "{full_path}"'
+        # push the text as a file instead of an inline base64 argument (no ARG_MAX limit, no encode/decode)
+        fd, local_tmp = tempfile.mkstemp(dir=self._temp_root)
+        # encode in 64K-character slices so peak memory doesn't include a full-size bytes copy
+        with os.fdopen(fd, "wb") as f:
+            for i in range(0, len(content), 65536):
+                f.write(content[i:i + 65536].encode("utf-8"))
+        device_tmp = f"/data/local/tmp/qadb_{os.path.basename(local_tmp)}"
+
+        push = TransferRunner(self.adb_path, ['push', local_tmp, device_tmp])
+        push.transfer_finished.connect(
+            lambda out, err, _: self._finish_save(out, err, filename, full_path, local_tmp, device_tmp)
+        )
+        self._start_thread(push)
 
-        t = ADBThread(self.adb_path, ['shell', save_cmd])
-        t.command_finished.connect(lambda out, err: self.save_complete(out, err, filename))
-        self._start_thread(t)
+    def _finish_save(self, output, error, filename, full_path, local_tmp, device_tmp):
+        try:
+            os.remove(local_tmp)
+        except OSError:
+            pass
+        if error:
+            self.save_complete(output, error, filename)
+            return
+        # cat into the existing file keeps its owner and mode, which a direct push would replace
+        src, dst = shlex.quote(device_tmp), shlex.quote(full_path)
+        save_cmd = self._root_cmd(f"if cat {src} > {dst}; then rm -f {src}; else rm -f {src}; false; fi")
+        self._shell(save_cmd, functools.partial(self.save_complete, filename=filename), session=True)
 
     def save_complete(self, output, error, filename):
         if error:
@@ -801,13 +1279,13 @@ class ADBFileExplorer(QMainWindow):
             self.statusBar.showMessage("Error saving file")
         else:
             self.statusBar.showMessage(f"File {filename} saved successfully to device")
-            self.refresh_file_list()
+            self._schedule_refresh()
 
     # -----------------------------
     # Pull / Push (threaded)
     # -----------------------------
     def pull_file(self, filename, save_path=None):
-        full_path = self._dpath(self.current_path, filename)
+        full_path = posixpath.join(self.current_path, filename)
         if save_path is None:
             save_path, _ = QFileDialog.getSaveFileName(self, "Save File As", filename, "All Files (*)")
             if not save_path:
@@ -816,14 +1294,15 @@ class ADBFileExplorer(QMainWindow):
 
         if self.is_root:
             device_temp = f"/data/local/tmp/{filename}"
-            dd_cmd = f'su -c "dd if=\\"{full_path}\\" of=\\"{device_temp}\\" && chmod 644 \\"{device_temp}\\""'
+            # 1M blocks instead of dd's default 512 bytes: far fewer read/write syscalls on large files
+            src, tmp = shlex.quote(full_path), shlex.quote(device_temp)
+            dd_cmd = self._root_cmd(f"dd if={src} of={tmp} bs=1M && chmod 644 {tmp}")
 
-            t = ADBThread(self.adb_path, ['shell', dd_cmd])
-            t.command_finished.connect(lambda out, err: self.pull_temp_file(out, err, filename, device_temp, save_path))
-            self._start_thread(t)
+            self._shell(dd_cmd, functools.partial(self.pull_temp_file, filename=filename, device_temp=device_temp,
+                                                  save_path=save_path))
         else:
             transfer = TransferRunner(self.adb_path, ['pull', full_path, save_path])
-            transfer.transfer_finished.connect(lambda out, err, dest: self.pull_complete(out, err, dest))
+            transfer.transfer_finished.connect(self.pull_complete)
             transfer.transfer_progress.connect(self.handle_transfer_progress)
             self._start_thread(transfer)
 
@@ -839,8 +1318,7 @@ class ADBFileExplorer(QMainWindow):
 
     def finish_root_pull(self, output, error, filename, device_temp, save_path):
 
-        cleanup = ADBThread(self.adb_path, ['shell', f'rm "{device_temp}"'])
-        self._start_thread(cleanup)
+        self._shell(f"rm {shlex.quote(device_temp)}", session=True)
         if error:
             QMessageBox.critical(self, "Error", f"Could not pull temporary file: {output}")
             self.statusBar.showMessage("Error pulling file")
@@ -860,7 +1338,7 @@ class ADBFileExplorer(QMainWindow):
         progress = self._make_progress(f"Pulling {name}...")
         android_path = source_path.replace('\\', '/')
         if is_directory:
-            self.chmod_and_pull(android_path, dest_path, name, progress)
+            self.tar_pull(android_path, dest_path, name, progress)
         else:
             transfer = TransferRunner(self.adb_path, ['pull', android_path, dest_path])
             transfer.transfer_finished.connect(lambda out, err, dest: self.handle_pull_result(out, err, name, progress, android_path, dest))
@@ -869,41 +1347,35 @@ class ADBFileExplorer(QMainWindow):
 
     def handle_pull_result(self, output, error, name, progress, source_path, dest_path, is_directory=False):
         if error:
-            self.statusBar.showMessage(f"Regular pull failed for {name}, trying chmod fallback...")
-            progress.setLabelText(f"Regular pull failed, trying chmod for {name}...")
-            self.chmod_and_pull(source_path, dest_path, name, progress)
+            self.statusBar.showMessage(f"Regular pull failed for {name}, trying tar fallback...")
+            progress.setLabelText(f"Regular pull failed, trying tar for {name}...")
+            self.tar_pull(source_path, dest_path, name, progress)
         else:
             progress.close()
             self.statusBar.showMessage(f"Successfully pulled {name}")
 
-    def chmod_and_pull(self, source_path, dest_path, name, progress):
-
-        chmod_thread = ADBThread(self.adb_path, ['shell', f'chmod -R 777 "{source_path}"'])
-        chmod_thread.command_finished.connect(lambda out, err: self.perform_pull_after_chmod(out, err, source_path, dest_path, name, progress))
-        self._start_thread(chmod_thread)
-
-    def perform_pull_after_chmod(self, output, error, source_path, dest_path, name, progress):
-        if error:
-            progress.close()
-            QMessageBox.critical(self, "Error", f"Failed to set permissions for {name}: {output}")
-            self.statusBar.showMessage(f"Failed to set permissions for {name}")
-            return
-        progress.setLabelText(f"Pulling {name} after chmod...")
-        transfer = TransferRunner(self.adb_path, ['pull', source_path, dest_path])
-        transfer.transfer_finished.connect(lambda out, err, dest: self.finish_chmod_pull(out, err, name, progress))
-        transfer.transfer_progress.connect(self.handle_transfer_progress)
-        self._start_thread(transfer)
-
-    def finish_chmod_pull(self, output, error, name, progress):
+    def tar_pull(self, source_path, dest_path, name, progress):
+        """Pull source_path to dest_path through a tar stream; reads as root when root mode is on, no chmod needed."""
+        parent, base = posixpath.split(source_path.rstrip("/"))
+        tar_cmd = self._root_cmd(f"tar c -C {shlex.quote(parent or '/')} {shlex.quote(base)} 2>/dev/null")
+        # the archive's top entry is base (== name for every caller), so unpacking next to dest_path recreates it
+        progress.setLabelText(f"Pulling {name} as a tar stream...")
+        job = TarPullJob(self.adb_path, tar_cmd, os.path.dirname(dest_path), name)
+        job.transfer_finished.connect(functools.partial(self.finish_tar_pull, name=name, progress=progress))
+        job.transfer_progress.connect(self.handle_transfer_progress)
+        self._start_thread(job)
+
+    def finish_tar_pull(self, output, error, dest_dir, name, progress):
         progress.close()
         if error:
-            QMessageBox.critical(self, "Error", f"Failed to pull {name} even after chmod: {output}")
+            QMessageBox.critical(self, "Error", f"Failed to pull {name}: {output}")
             self.statusBar.showMessage(f"Failed to pull {name}")
-        else:
-            self.statusBar.showMessage(f"Successfully pulled {name} using chmod method")
+            return
+        note = f" ({output})" if output else ""
+        self.statusBar.showMessage(f"Successfully pulled {name}{note}")
 
     def pull_selected_items(self):
-        selected_rows = set(index.row() for index in self.table.selectedIndexes())
+        selected_rows = {index.row() for index in self.table.selectedIndexes()}
         if not selected_rows:
             return
         items_to_pull = []
@@ -918,81 +1390,127 @@ class ADBFileExplorer(QMainWindow):
         dest_dir = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
         if not dest_dir:
             return
-        for name, is_directory in items_to_pull:
-            source_path = self._dpath(self.current_path, name)
-            self.start_pull(source_path, dest_dir, name, is_directory)
+        items = [(posixpath.join(self.current_path, name), name, is_directory) for name, is_directory in items_to_pull]
+        for i in range(0, len(items), _MAX_BATCH_SOURCES):
+            self.start_batch_pull(items[i:i + _MAX_BATCH_SOURCES], dest_dir)
+
+    def start_batch_pull(self, items, dest_dir):
+        """Pull several (source_path, name, is_directory) items with one adb pull; adb pays its sync setup once."""
+        if len(items) == 1:
+            self.start_pull(items[0][0], dest_dir, items[0][1], items[0][2])
+            return
+        progress = self._make_progress(f"Pulling {len(items)} items...")
+        progress.setRange(0, len(items))
+        sources = {src.rstrip("/") for src, _, _ in items}
+        done = set()
+
+        def on_line(line):
+            # adb prints "<source>: N file(s) pulled..." once per finished source
+            src = line.partition(":")[0].rstrip("/")
+            if src in sources and src not in done:
+                done.add(src)
+                progress.setValue(len(done))
+            self.handle_transfer_progress(line)
+
+        transfer = TransferRunner(self.adb_path, ['pull'] + [src for src, _, _ in items] + [dest_dir])
+        transfer.transfer_finished.connect(lambda out, err, dest: self.handle_batch_pull_result(out, err, items, dest_dir, progress))
+        transfer.transfer_progress.connect(on_line)
+        self._start_thread(transfer)
+
+    def handle_batch_pull_result(self, output, error, items, dest_dir, progress):
+        progress.close()
+        if error:
+            # fall back to one pull per item, which also retries unreadable items via chmod
+            self.statusBar.showMessage("Batch pull failed, retrying items individually...")
+            for source_path, name, is_directory in items:
+                self.start_pull(source_path, dest_dir, name, is_directory)
+        else:
+            self.statusBar.showMessage(f"Successfully pulled {len(items)} items to {dest_dir}")
 
     def push_file(self):
         files, _ = QFileDialog.getOpenFileNames(self, "Select Files to Push")
         if not files:
             return
-        for file_path in files:
-            dest_path = self._dpath(self.current_path, os.path.basename(file_path))
-            progress = self._make_progress(f"Pushing {os.path.basename(file_path)}...")
-            transfer = TransferRunner(self.adb_path, ['push', file_path, dest_path])
-            transfer.transfer_finished.connect(lambda out, err, dest, p=progress: self.handle_push_result(out, err, file_path, p))
+        # adb push accepts many sources when the target is a directory
+        dest_dir = self.current_path.rstrip("/") + "/"
+        for i in range(0, len(files), _MAX_BATCH_SOURCES):
+            batch = files[i:i + _MAX_BATCH_SOURCES]
+            label = os.path.basename(batch[0]) if len(batch) == 1 else f"{len(batch)} files"
+            progress = self._make_progress(f"Pushing {label}...")
+            transfer = TransferRunner(self.adb_path, ['push'] + batch + [dest_dir])
+            transfer.transfer_finished.connect(lambda out, err, dest, p=progress, l=label: self.handle_push_result(out, err, l, p))
             transfer.transfer_progress.connect(self.handle_transfer_progress)
             self._start_thread(transfer)
 
-    def handle_push_result(self, output, error, file_path, progress):
+    def handle_push_result(self, output, error, label, progress):
         progress.close()
         if error:
-            QMessageBox.critical(self, "Error", f"Failed to push {os.path.basename(file_path)}: {output}")
+            QMessageBox.critical(self, "Error", f"Failed to push {label}: {output}")
         else:
-            self.statusBar.showMessage(f"Successfully pushed {os.path.basename(file_path)}")
-            self.refresh_file_list()
+            self.statusBar.showMessage(f"Successfully pushed {label}")
+            self._schedule_refresh()
 
     def handle_transfer_progress(self, line):
+        # adb can print many lines per second; repainting the status bar for each one is wasted work.
+        # the finish handlers always set a final message, so dropped lines are never the last word.
+        now = time.monotonic()
+        if now - self._last_status_ts < 0.1:
+            return
+        self._last_status_ts = now
         self.statusBar.showMessage(line)
 
     # -----------------------------
     # Copy / Move / Paste
     # -----------------------------
     def copy_selected_items(self, copy_mode=True):
-        selected_rows = set(index.row() for index in self.table.selectedIndexes())
+        selected_rows = {index.row() for index in self.table.selectedIndexes()}
         if not selected_rows:
             return
         self.selected_items = []
         for row in selected_rows:
             name_item = self.table.item(row, 0)
             if name_item and name_item.text() != "..":
-                self.selected_items.append(self._dpath(self.current_path, name_item.text()))
+                self.selected_items.append(posixpath.join(self.current_path, name_item.text()))
         self.copy_mode = copy_mode
         self.statusBar.showMessage(f"{'Copied' if copy_mode else 'Cut'} {len(self.selected_items)} item(s)")
 
     def paste_items(self):
         if not self.selected_items:
             return
-        for source_path in self.selected_items:
-            filename = os.path.basename(source_path)
-            dest_path = self._dpath(self.current_path, filename)
-            if source_path == dest_path:
-                continue
-            if self.copy_mode:
-
-                check_thread = ADBThread(self.adb_path, ['shell', f'[ -d "{source_path}" ] && echo "dir" || echo "file"'])
-                check_thread.command_finished.connect(lambda out, err, s=source_path, d=dest_path: self.perform_copy(s, d, "dir" in out.strip()))
-                self._start_thread(check_thread)
-            else:
-
-                move_thread = ADBThread(self.adb_path, ['shell', f'mv "{source_path}" "{dest_path}"'])
-                move_thread.command_finished.connect(lambda out, err: self.handle_paste_result(out, err))
-                self._start_thread(move_thread)
+        sources = [src for src in self.selected_items
+                   if posixpath.join(self.current_path, posixpath.basename(src)) != src]
+        if not sources:
+            self.selected_items = []
+            return
+        # the listing on screen already tells us what would be overwritten; ask once for all of it
+        existing = {row[0] for row in self._rows}
+        clashes = [posixpath.basename(src) for src in sources if posixpath.basename(src) in existing]
+        if clashes:
+            shown = ", ".join(clashes[:5]) + (f" and {len(clashes) - 5} more" if len(clashes) > 5 else "")
+            reply = QMessageBox.question(
+                self, "Overwrite?", f"{len(clashes)} item(s) already exist here: {shown}.\nOverwrite them?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return
         self.selected_items = []
-
-    def perform_copy(self, source_path, dest_path, is_directory):
-        copy_cmd = f'cp -R "{source_path}" "{dest_path}"' if is_directory else f'cp "{source_path}" "{dest_path}"'
-
-        copy_thread = ADBThread(self.adb_path, ['shell', copy_cmd])
-        copy_thread.command_finished.connect(lambda out, err: self.handle_paste_result(out, err))
-        self._start_thread(copy_thread)
+        if not self.copy_mode:
+            # the source directories' cached listings still show the moved items
+            for src in sources:
+                self._invalidate_listing(posixpath.dirname(src))
+        # one cp/mv per batch into the current directory; cp -R copies files and folders alike,
+        # so no per-item type probe is needed
+        op = 'cp -R' if self.copy_mode else 'mv'
+        for i in range(0, len(sources), _MAX_BATCH_SOURCES):
+            quoted = " ".join(map(shlex.quote, sources[i:i + _MAX_BATCH_SOURCES]))
+            self._shell(f"{op} {quoted} {shlex.quote(self.current_path + '/')}", self.handle_paste_result)
 
     def handle_paste_result(self, output, error):
         if error:
             QMessageBox.critical(self, "Error", f"Failed to paste: {output}")
         else:
             self.statusBar.showMessage("Paste operation completed")
-            self.refresh_file_list()
+            self._schedule_refresh()
 
     # -----------------------------
     # File/directory operations
@@ -1004,19 +1522,17 @@ class ADBFileExplorer(QMainWindow):
         if '/' in folder_name or '\\' in folder_name:
             QMessageBox.critical(self, "Error", "Folder name cannot contain / or \\")
             return
-        full_path = self._dpath(self.current_path, folder_name)
-        mkdir_cmd = self._root_cmd(f'mkdir -p \\"{full_path}\\"') if self.is_root else f'mkdir -p "{full_path}"'
+        full_path = posixpath.join(self.current_path, folder_name)
+        mkdir_cmd = self._root_cmd(f"mkdir -p {shlex.quote(full_path)}")
 
-        mkdir_thread = ADBThread(self.adb_path, ['shell', mkdir_cmd])
-        mkdir_thread.command_finished.connect(lambda out, err: self.handle_mkdir_result(out, err, folder_name))
-        self._start_thread(mkdir_thread)
+        self._shell(mkdir_cmd, functools.partial(self.handle_mkdir_result, folder_name=folder_name), session=True)
 
     def handle_mkdir_result(self, output, error, folder_name):
         if error:
             QMessageBox.critical(self, "Error", f"Failed to create folder {folder_name}: {output}")
         else:
             self.statusBar.showMessage(f"Created folder {folder_name}")
-            self.refresh_file_list()
+            self._schedule_refresh()
 
 
     def create_new_file(self):
@@ -1026,26 +1542,24 @@ class ADBFileExplorer(QMainWindow):
         if '/' in file_name or '\\' in file_name:
             QMessageBox.critical(self, "Error", "File name cannot contain / or \\")
             return
-        full_path = self._dpath(self.current_path, file_name)
-        touch_cmd = self._root_cmd(f'touch \\"{full_path}\\"') if self.is_root else f'touch "{full_path}"'
+        full_path = posixpath.join(self.current_path, file_name)
+        touch_cmd = self._root_cmd(f"touch {shlex.quote(full_path)}")
 
-        touch_thread = ADBThread(self.adb_path, ['shell', touch_cmd])
-        touch_thread.command_finished.connect(lambda out, err: self.handle_touch_result(out, err, file_name))
-        self._start_thread(touch_thread)
+        self._shell(touch_cmd, functools.partial(self.handle_touch_result, file_name=file_name), session=True)
 
     def handle_touch_result(self, output, error, file_name):
         if error:
             QMessageBox.critical(self, "Error", f"Failed to create file {file_name}: {output}")
         else:
             self.statusBar.showMessage(f"Created file {file_name}")
-            self.refresh_file_list()
+            self._schedule_refresh()
 
 
     def install_apk(self, name):
         if not name.endswith('.apk'):
             return
-        full_path = self._dpath(self.current_path, name)
-        install_thread = RemoteAPKInstallThread(full_path, self.is_root)
+        full_path = posixpath.join(self.current_path, name)
+        install_thread = RemoteAPKInstallJob(full_path, self.is_root)
         install_thread.install_finished.connect(
             lambda result: self._handle_install_apk_result(result, name)
         )
@@ -1058,17 +1572,14 @@ class ADBFileExplorer(QMainWindow):
     def execute_shell_script(self, name):
         if not name.endswith('.sh'):
             return
-        full_path = self._dpath(self.current_path, name)
+        full_path = posixpath.join(self.current_path, name)
         if self.is_root:
-            chmod_cmd = self._root_cmd(f'chmod +x \\"{full_path}\\"')
-            chmod_thread = ADBThread(self.adb_path, ['shell', chmod_cmd])
-            chmod_thread.command_finished.connect(
-                lambda out, err: self._handle_root_script_prepare(out, err, full_path, name)
-            )
-            self._start_thread(chmod_thread)
+            chmod_cmd = self._root_cmd(f"chmod +x {shlex.quote(full_path)}")
+            self._shell(chmod_cmd, functools.partial(self._handle_root_script_prepare, full_path=full_path, name=name),
+                        session=True)
         else:
             self._run_live_command(
-                ['shell', f'sh "{full_path}"'],
+                ['shell', f"sh {shlex.quote(full_path)}"],
                 title=f"Executing: {name}",
                 header_html=f"Output of <b>{name}</b>",
                 success_status=f"Script {name} executed successfully.",
@@ -1082,7 +1593,7 @@ class ADBFileExplorer(QMainWindow):
             return
 
         self._run_live_command(
-            ['shell', self._root_cmd(f'sh \\"{full_path}\\"')],
+            ['shell', self._root_cmd(f"sh {shlex.quote(full_path)}")],
             title=f"Executing: {name}",
             header_html=f"Output of <b>{name}</b>",
             success_status=f"Script {name} executed successfully.",
@@ -1254,21 +1765,18 @@ class ADBFileExplorer(QMainWindow):
         new_name, ok = QInputDialog.getText(self, "Rename", "New name:", text=name)
         if not ok or not new_name or new_name == name:
             return
-        old_path = self._dpath(self.current_path, name)
-        new_path = self._dpath(self.current_path, new_name)
-        mv_cmd = self._root_cmd(f'mv \\"{old_path}\\" \\"{new_path}\\"') \
-            if self.is_root else f'mv "{old_path}" "{new_path}"'
+        old_path = posixpath.join(self.current_path, name)
+        new_path = posixpath.join(self.current_path, new_name)
+        mv_cmd = self._root_cmd(f"mv {shlex.quote(old_path)} {shlex.quote(new_path)}")
 
-        rename_thread = ADBThread(self.adb_path, ['shell', mv_cmd])
-        rename_thread.command_finished.connect(lambda out, err: self.handle_rename_result(out, err, name, new_name))
-        self._start_thread(rename_thread)
+        self._shell(mv_cmd, functools.partial(self.handle_rename_result, old_name=name, new_name=new_name), session=True)
 
     def handle_rename_result(self, output, error, old_name, new_name):
         if error:
             QMessageBox.critical(self, "Error", f"Failed to rename {old_name}: {output}")
         else:
             self.statusBar.showMessage(f"Renamed {old_name} to {new_name}")
-            self.refresh_file_list()
+            self._schedule_refresh()
 
     def delete_item(self, name, confirm=True):
         if confirm:
@@ -1278,37 +1786,35 @@ class ADBFileExplorer(QMainWindow):
             )
             if reply != QMessageBox.StandardButton.Yes:
                 return
-        path = self._dpath(self.current_path, name)
-        check_cmd = self._root_cmd(f'[ -d \\"{path}\\" ] && echo \\"dir\\" || echo \\"file\\"') \
-            if self.is_root else f'[ -d "{path}" ] && echo "dir" || echo "file"'
+        self.delete_names([name])
 
-        is_dir_thread = ADBThread(self.adb_path, ['shell', check_cmd])
-        is_dir_thread.command_finished.connect(lambda out, err: self.perform_delete(path, name, "dir" in out.strip()))
-        self._start_thread(is_dir_thread)
+    def delete_names(self, names):
+        """Delete entries of the current directory with one rm -rf per batch (no per-item type probe)."""
+        for i in range(0, len(names), _MAX_BATCH_SOURCES):
+            batch = names[i:i + _MAX_BATCH_SOURCES]
+            paths = [posixpath.join(self.current_path, name) for name in batch]
+            for path in paths:
+                self._invalidate_listing(path)
+            # rm takes many operands; plain rm -rf works on every toybox/busybox build
+            delete_cmd = self._root_cmd(f"rm -rf {' '.join(map(shlex.quote, paths))}")
+            label = batch[0] if len(batch) == 1 else f"{len(batch)} items"
 
-    def perform_delete(self, path, name, is_directory):
-        delete_command = f'rm -rf "{path}"' if is_directory else f'rm "{path}"'
-        delete_cmd = self._root_cmd(delete_command.replace('"', '\\"')) \
-            if self.is_root else delete_command
-
-        delete_thread = ADBThread(self.adb_path, ['shell', delete_cmd])
-        delete_thread.command_finished.connect(lambda out, err: self.handle_delete_result(out, err, name))
-        self._start_thread(delete_thread)
+            self._shell(delete_cmd, functools.partial(self.handle_delete_result, name=label))
 
     def handle_delete_result(self, output, error, name):
         if error:
             QMessageBox.critical(self, "Error", f"Failed to delete {name}: {output}")
         else:
             self.statusBar.showMessage(f"Deleted {name}")
-            self.refresh_file_list()
+            self._schedule_refresh()
 
     def delete_selected_items(self):
-        selected_rows = set(index.row() for index in self.table.selectedIndexes())
+        selected_rows = {index.row() for index in self.table.selectedIndexes()}
         if not selected_rows:
             return
         items_to_delete = [
-            self.table.item(row, 0).text() for row in selected_rows
-            if self.table.item(row, 0) and self.table.item(row, 0).text() != ".."
+            name for row in selected_rows
+            if (item := self.table.item(row, 0)) and (name := item.text()) != ".."
         ]
         if not items_to_delete:
             return
@@ -1319,43 +1825,67 @@ class ADBFileExplorer(QMainWindow):
         )
         if confirm != QMessageBox.StandardButton.Yes:
             return
-        for name in items_to_delete:
-            self.delete_item(name, confirm=False)
+        self.delete_names(items_to_delete)
 
     # -----------------------------
     # Sorting, filtering, properties
     # -----------------------------
     def filter_table_by_search(self, search_text):
         search_text = search_text.strip().lower()
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 0)
-            if name_item:
-                is_hidden = search_text not in name_item.text().lower()
-                self.table.setRowHidden(row, is_hidden)
+        # typing more characters can only hide rows, so rows that are already hidden stay hidden
+        narrowing = bool(self._last_search) and search_text.startswith(self._last_search)
+        self._last_search = search_text
+        hidden = self._hidden
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row, name in enumerate(self._lower_names):
+                if narrowing and hidden[row]:
+                    continue
+                is_hidden = search_text not in name
+                if is_hidden != hidden[row]:
+                    hidden[row] = is_hidden
+                    self.table.setRowHidden(row, is_hidden)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def sort_table(self):
-
+        """Sort self._rows in Python and refill the table; Qt's item-by-item sort is never used."""
         sort_column = self.sort_combo.currentIndex()
+        self._rows.sort(key=_SORT_KEYS[sort_column],
+                        reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+        self.table.horizontalHeader().setSortIndicator(sort_column, self._sort_order)
 
-        # Remove '..' before sorting so it is not displaced by sortByColumn().
-        dotdot_row = None
-        for r in range(self.table.rowCount()):
-            item = self.table.item(r, 0)
-            if item and item.text() == "..":
-                dotdot_row = r
-                break
-        if dotdot_row is not None:
-            self.table.removeRow(dotdot_row)
+        # '..' stays on top for any directory that has a parent
+        entries = [(r[0], r[1], r[2], r[3]) for r in self._rows]
+        if self.current_path != "/" and not self.current_path.endswith(":/"):
+            entries.insert(0, ("..", "Folder", "-", "-"))
 
-        self.table.sortByColumn(sort_column, self._sort_order)
+        # one repaint and no per-cell signals for the whole batch
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            # recycle existing items and only allocate for rows beyond the previous count
+            self.table.setRowCount(len(entries))
+            for row, texts in enumerate(entries):
+                for col, text in enumerate(texts):
+                    item = self.table.item(row, col)
+                    if item is None:
+                        self.table.setItem(row, col, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+                        if col == 0 and item.toolTip():
+                            item.setToolTip("")
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
 
-        # Re-insert '..' at the top for any directory that has a parent.
-        if self.current_path != "/" and not self.current_path.endswith(":/"):
-            self.table.insertRow(0)
-            self.table.setItem(0, 0, QTableWidgetItem(".."))
-            self.table.setItem(0, 1, QTableWidgetItem("Folder"))
-            self.table.setItem(0, 2, QTableWidgetItem("-"))
-            self.table.setItem(0, 3, QTableWidgetItem("-"))
+        # recycled rows keep their hidden flag, so the hidden list is resized rather than reset,
+        # and a full (non-narrowing) filter pass brings every row in line with the current query
+        self._lower_names = [texts[0].lower() for texts in entries]
+        del self._hidden[len(entries):]
+        self._hidden.extend([False] * (len(entries) - len(self._hidden)))
+        self._last_search = ""
+        self.filter_table_by_search(self.search_field.text())
 
     def _on_sort_combo_changed(self):
         """Slot for sort combo changes. Always resets to ascending for the new column."""
@@ -1381,17 +1911,15 @@ class ADBFileExplorer(QMainWindow):
             self.sort_combo.setCurrentIndex(column)
 
     def show_properties(self, name, is_folder):
-        full_path = self._dpath(self.current_path, name)
+        full_path = posixpath.join(self.current_path, name)
         if is_folder:
-
-            size_thread = ADBThread(self.adb_path, ['shell', f'du -sh "{full_path}"'])
-            size_thread.command_finished.connect(lambda out, err: self.show_folder_properties(name, full_path, out, err))
-            self._start_thread(size_thread)
+            # du can run for a while on big trees, so it gets its own adb process
+            self._cached_shell(full_path, f"du -sh {shlex.quote(full_path)}",
+                               lambda out, err: self.show_folder_properties(name, full_path, out, err),
+                               use_session=False)
         else:
-
-            stat_thread = ADBThread(self.adb_path, ['shell', f'ls -la "{full_path}"'])
-            stat_thread.command_finished.connect(lambda out, err: self.show_file_properties(name, full_path, out, err))
-            self._start_thread(stat_thread)
+            self._cached_shell(full_path, f"ls -la {shlex.quote(full_path)}",
+                               lambda out, err: self.show_file_properties(name, full_path, out, err))
 
     def show_folder_properties(self, name, path, size_output, error):
         if error:
@@ -1401,9 +1929,8 @@ class ADBFileExplorer(QMainWindow):
         if size_output.strip():
             size = size_output.strip().split()[0]
 
-        stat_thread = ADBThread(self.adb_path, ['shell', f'ls -lad "{path}"'])
-        stat_thread.command_finished.connect(lambda out, err: self.display_properties(name, path, "Folder", size, out, err))
-        self._start_thread(stat_thread)
+        self._cached_shell(path, f"ls -lad {shlex.quote(path)}",
+                           lambda out, err: self.display_properties(name, path, "Folder", size, out, err))
 
     def show_file_properties(self, name, path, ls_output, error):
         if error:
@@ -1446,10 +1973,13 @@ class ADBFileExplorer(QMainWindow):
         QMessageBox.information(self, f"Properties of {name}", properties)
 
     def closeEvent(self, event):
-        for thread in self.threads:
-            if thread.isRunning():
-                thread.terminate()
-                thread.wait(100)
+        # drop queued jobs and kill the adb processes of running ones so the pool can wind down
+        self.pool.clear()
+        self.transfer_pool.clear()
+        for job in list(self._jobs):
+            job.cancel()
+        self.shell.close()
+        shutil.rmtree(self._temp_root, ignore_errors=True)
         event.accept()
 
     def show_chmod_dialog(self, name, is_folder):
@@ -1457,7 +1987,7 @@ class ADBFileExplorer(QMainWindow):
         live chmod preview, Apply and Revert buttons.
         Robust against early signals and works with PyQt6 enums.
         """
-        full_path = self._dpath(self.current_path, name)
+        full_path = posixpath.join(self.current_path, name)
 
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Permissions - {name}")
@@ -1497,170 +2027,162 @@ class ADBFileExplorer(QMainWindow):
         btn_layout.addWidget(close_btn)
         layout.addLayout(btn_layout)
 
+        # the handlers below are methods; everything they need hangs off the dialog
+        dialog._name = name
+        dialog._is_folder = is_folder
+        dialog._full_path = full_path
+        dialog._quoted = shlex.quote(full_path)
+        dialog._checkboxes = checkboxes
+        dialog._preview_label = preview_label
         dialog._original_mode = None
         dialog._current_mode = None
 
-        def perms_to_mode():
-            def bits_for(col):
-                r = 4 if checkboxes[(col, "r")].isChecked() else 0
-                w = 2 if checkboxes[(col, "w")].isChecked() else 0
-                x = 1 if checkboxes[(col, "x")].isChecked() else 0
-                return r + w + x
-            owner = bits_for("owner")
-            group = bits_for("group")
-            other = bits_for("other")
-            return f"{owner}{group}{other}"
-
-        def set_checkboxes_from_mode(mode_str):
-            try:
-                mode = mode_str.strip()
-                if mode.startswith("0") and len(mode) == 4:
-                    mode = mode[1:]
-                if len(mode) != 3:
-                    return
-                owner, group, other = [int(ch) for ch in mode]
-                def set_bits(col, val):
-                    checkboxes[(col, "r")].setChecked(bool(val & 4))
-                    checkboxes[(col, "w")].setChecked(bool(val & 2))
-                    checkboxes[(col, "x")].setChecked(bool(val & 1))
-                set_bits("owner", owner)
-                set_bits("group", group)
-                set_bits("other", other)
-            except Exception:
-                pass
-
-        def update_preview():
-            mode = perms_to_mode()
-            dialog._current_mode = mode
-            preview_label.setText(f'chmod {mode} "{full_path}"')
-
+        update_preview = functools.partial(self._chmod_update_preview, dialog)
         for cb in checkboxes.values():
             cb.stateChanged.connect(update_preview)
 
-        def handle_stat_result(output, err):
-            out = (output or "").strip()
-            mode_candidate = None
-            if out:
-                m = re.search(r'\b([0-7]{3,4})\b', out)
-                if m:
-                    mode_candidate = m.group(1)
-                else:
-                    m2 = re.search(r'^(?P<perm>[-drlxspsbtStT]{10,})', out, re.M)
-                    if m2:
-                        permstr = m2.group('perm')
-                        mapping = {'r': 4, 'w': 2, 'x': 1, '-': 0}
-                        triplets = [permstr[1:4], permstr[4:7], permstr[7:10]]
-                        digits = []
-                        for t in triplets:
-                            s = 0
-                            for ch in t:
-                                s += mapping.get(ch, 0)
-                            digits.append(str(s))
-                        mode_candidate = ''.join(digits)
-
-            if not mode_candidate:
-                mode_candidate = "644" if not is_folder else "755"
-
-            dialog._original_mode = mode_candidate
-            set_checkboxes_from_mode(mode_candidate)
-            update_preview()
-
-        stat_cmd = f'stat -c %a "{full_path}"'
-        ls_cmd = f'ls -ld "{full_path}"'
-
-
-        stat_thread = ADBThread(self.adb_path, ['shell', stat_cmd])
-
-        def stat_cb(out, err):
-            if (out or "").strip():
-                handle_stat_result(out, err)
-            else:
+        # the listing already carries the mode; only ask the device when it can't be expressed as rwx triples
+        listed = next((_mode_from_perms(row[8]) for row in self._rows if row[0] == name), None)
+        if listed:
+            self._on_chmod_stat(listed, False, dialog)
+        else:
+            self._cached_shell(full_path, f'stat -c %a {dialog._quoted}',
+                               functools.partial(self._on_chmod_stat_probe, dialog=dialog))
 
-                ls_thread = ADBThread(self.adb_path, ['shell', ls_cmd])
-                ls_thread.command_finished.connect(handle_stat_result)
-                self._start_thread(ls_thread)
+        apply_btn.clicked.connect(functools.partial(self._on_chmod_apply, dialog))
+        revert_btn.clicked.connect(functools.partial(self._on_chmod_revert, dialog))
+        close_btn.clicked.connect(dialog.reject)
 
-        stat_thread.command_finished.connect(stat_cb)
-        self._start_thread(stat_thread)
+        dialog.resize(460, 280)
+        dialog.exec()
 
-        def on_revert():
-            if dialog._original_mode:
-                set_checkboxes_from_mode(dialog._original_mode)
-                update_preview()
+    def _chmod_dialog_mode(self, dialog):
+        """Octal mode string ('644') for the boxes ticked in the chmod dialog."""
+        def bits_for(col):
+            r = 4 if dialog._checkboxes[(col, "r")].isChecked() else 0
+            w = 2 if dialog._checkboxes[(col, "w")].isChecked() else 0
+            x = 1 if dialog._checkboxes[(col, "x")].isChecked() else 0
+            return r + w + x
+        return f"{bits_for('owner')}{bits_for('group')}{bits_for('other')}"
 
-        def on_apply():
-            mode = dialog._current_mode or perms_to_mode()
-            if not mode:
-                QMessageBox.critical(dialog, "Error", "Invalid permission selection.")
+    def _chmod_set_checkboxes(self, dialog, mode_str):
+        try:
+            mode = mode_str.strip()
+            if mode.startswith("0") and len(mode) == 4:
+                mode = mode[1:]
+            if len(mode) != 3:
                 return
+            for col, ch in zip(("owner", "group", "other"), mode):
+                val = int(ch)
+                dialog._checkboxes[(col, "r")].setChecked(bool(val & 4))
+                dialog._checkboxes[(col, "w")].setChecked(bool(val & 2))
+                dialog._checkboxes[(col, "x")].setChecked(bool(val & 1))
+        except Exception:
+            pass
+
+    def _chmod_update_preview(self, dialog, *_):
+        mode = self._chmod_dialog_mode(dialog)
+        dialog._current_mode = mode
+        dialog._preview_label.setText(f'chmod {mode} {dialog._quoted}')
 
-            emulated_path = (
-                "/storage/emulated/" in full_path
-                or full_path.startswith("/sdcard")
-                or ("/storage/" in full_path and "/emulated/" in full_path)
+    def _on_chmod_stat_probe(self, output, error, dialog):
+        if (output or "").strip():
+            self._on_chmod_stat(output, error, dialog)
+        else:
+            self._cached_shell(dialog._full_path, f'ls -ld {dialog._quoted}',
+                               functools.partial(self._on_chmod_stat, dialog=dialog))
+
+    def _on_chmod_stat(self, output, error, dialog):
+        """Seed the chmod dialog from 'stat -c %a' or 'ls -ld' output (or a mode taken from the listing)."""
+        out = (output or "").strip()
+        mode_candidate = None
+        if out:
+            m = _OCTAL_RE.search(out)
+            if m:
+                mode_candidate = m.group(1)
+            else:
+                m2 = _PERM_RE.search(out)
+                if m2:
+                    permstr = m2.group('perm')
+                    mapping = {'r': 4, 'w': 2, 'x': 1, '-': 0}
+                    triplets = [permstr[1:4], permstr[4:7], permstr[7:10]]
+                    digits = []
+                    for t in triplets:
+                        s = 0
+                        for ch in t:
+                            s += mapping.get(ch, 0)
+                        digits.append(str(s))
+                    mode_candidate = ''.join(digits)
+
+        if not mode_candidate:
+            mode_candidate = "644" if not dialog._is_folder else "755"
+
+        dialog._original_mode = mode_candidate
+        self._chmod_set_checkboxes(dialog, mode_candidate)
+        self._chmod_update_preview(dialog)
+
+    def _on_chmod_revert(self, dialog):
+        if dialog._original_mode:
+            self._chmod_set_checkboxes(dialog, dialog._original_mode)
+            self._chmod_update_preview(dialog)
+
+    def _on_chmod_apply(self, dialog):
+        full_path, quoted = dialog._full_path, dialog._quoted
+        mode = dialog._current_mode or self._chmod_dialog_mode(dialog)
+        if not mode:
+            QMessageBox.critical(dialog, "Error", "Invalid permission selection.")
+            return
+        if dialog._original_mode and mode.lstrip("0") == dialog._original_mode.lstrip("0"):
+            # nothing changed; skip the chmod + verify round-trips
+            dialog.accept()
+            return
+
+        emulated_path = (full_path.startswith(_EMULATED_PREFIXES)
+                         or ("/storage/" in full_path and "/emulated/" in full_path))
+
+        if emulated_path:
+            proceed = QMessageBox.warning(
+                dialog,
+                "Emulated storage - chmod may be ignored",
+                "Target appears to be on emulated/external storage. "
+                "On many Android devices, sdcardfs/FUSE prevents chmod from changing permissions.\n\n"
+                "Proceed anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
+            if proceed != QMessageBox.StandardButton.Yes:
+                return
 
+        # chmod, read the mode back and compare in one shell; stat runs even if chmod failed so we can report it.
+        # the verdict is the last line, after any error text from chmod
+        expected = mode.lstrip("0") or "0"  # stat -c %a prints no leading zeros
+        chmod_cmd = self._root_cmd(f'chmod {mode} {quoted}; cur=$(stat -c %a {quoted});'
+                                   f' [ "$cur" = {expected} ] && echo "OK:$cur" || echo "FAIL:$cur"')
+        self._shell(chmod_cmd, functools.partial(self._on_chmod_finished, dialog=dialog, emulated_path=emulated_path),
+                    session=True)
+
+    def _on_chmod_finished(self, output, error, dialog, emulated_path):
+        stat_text = (output or "").strip()
+        verdict, _, current_mode = stat_text.rpartition("\n")[2].partition(":")
+
+        if verdict == "OK":
+            self.statusBar.showMessage(f"Permissions set to {current_mode} for {dialog._name}")
+            dialog.accept()
+        else:
             if emulated_path:
-                proceed = QMessageBox.warning(
+                QMessageBox.warning(
                     dialog,
-                    "Emulated storage - chmod may be ignored",
-                    "Target appears to be on emulated/external storage. "
-                    "On many Android devices, sdcardfs/FUSE prevents chmod from changing permissions.\n\n"
-                    "Proceed anyway?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                    "Permissions Unchanged",
+                    "chmod completed but permissions did not change (sdcardfs/FUSE likely ignores chmod on this path).\n\n"
+                    "Move the file to a writable native partition (e.g. /data) to change UNIX permissions."
                 )
-                if proceed != QMessageBox.StandardButton.Yes:
-                    return
-
-
-            chmod_cmd = self._root_cmd(f'chmod {mode} \\"{full_path}\\"') if self.is_root else f'chmod {mode} "{full_path}"'
-            apply_thread = ADBThread(self.adb_path, ['shell', chmod_cmd])
-
-            def _on_chmod_finished(output, err):
-                stat_verify_cmd = f'stat -c %a "{full_path}"'
-
-                stat_verify_thread = ADBThread(self.adb_path, ['shell', stat_verify_cmd])
-
-                def _on_stat_finished(stat_out, stat_err):
-                    stat_text = (stat_out or "").strip()
-                    m = re.search(r'([0-7]{3,4})', stat_text)
-                    current_mode = m.group(1) if m else None
-
-                    expected = mode.lstrip("0")
-                    current = current_mode.lstrip("0") if current_mode else None
-
-                    if current and current == expected:
-                        self.statusBar.showMessage(f"Permissions set to {current} for {name}")
-                        dialog.accept()
-                        self.refresh_file_list()
-                    else:
-                        if emulated_path:
-                            QMessageBox.warning(
-                                dialog,
-                                "Permissions Unchanged",
-                                "chmod completed but permissions did not change (sdcardfs/FUSE likely ignores chmod on this path).\n\n"
-                                "Move the file to a writable native partition (e.g. /data) to change UNIX permissions."
-                            )
-                        else:
-                            QMessageBox.critical(
-                                dialog,
-                                "Failed to Apply Permissions",
-                                f"Permissions did not change as expected. Current: {current_mode or '<unknown>'}\nRaw output:\n{stat_text}"
-                            )
-                        self.refresh_file_list()
-
-                stat_verify_thread.command_finished.connect(_on_stat_finished)
-                self._start_thread(stat_verify_thread)
-
-            apply_thread.command_finished.connect(_on_chmod_finished)
-            self._start_thread(apply_thread)
-
-        apply_btn.clicked.connect(on_apply)
-        revert_btn.clicked.connect(on_revert)
-        close_btn.clicked.connect(dialog.reject)
-
-        dialog.resize(460, 280)
-        dialog.exec()
+            else:
+                QMessageBox.critical(
+                    dialog,
+                    "Failed to Apply Permissions",
+                    f"Permissions did not change as expected. Current: {current_mode or '<unknown>'}\nRaw output:\n{stat_text}"
+                )
+        # either way the modes kept from the listing may be stale; rapid Apply clicks share one refresh
+        self._schedule_refresh()
 
 
 def main():
@@ -7,9 +7,12 @@ Detects device state via adb and fastboot, calculates partition sizes and automa
 
 import sys
 import os
+import re
 import subprocess
 import time
 import webbrowser
+from collections import deque
+from itertools import islice
 
 from util.resource import get_root_dir, resource_path
 from util.toolpaths import ToolPaths
@@ -22,7 +25,7 @@ from main.adbfunc import CommandRunner
 
 from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QPlainTextEdit,
     QFileDialog, QMessageBox, QFrame, QLabel, QApplication
 )
 from PyQt6.QtGui import QFont
@@ -37,6 +40,12 @@ except Exception:
     usb = None
     _PYUSB_AVAILABLE = False
 
+# lines kept in the log view
+_LOG_MAX_LINES = 2000
+# 'fastboot getvar all' size lines, e.g. "(bootloader) partition-size:super: 0x200000000".
+# system_a/_b count as system (fastbootd lists the logical slots); system_ext etc. do not
+_PARTITION_SIZE_RE = re.compile(r"partition-size:(super|system(?:_[ab])?):\s*(\S+)", re.I)
+
 
 class DeviceScannerWorker(QThread):
     """
@@ -77,7 +86,7 @@ class DeviceScannerWorker(QThread):
             )
             adb_devs = [
                 parts[0]
-                for line in adb_proc.stdout.splitlines()[1:]
+                for line in islice(adb_proc.stdout.splitlines(), 1, None)  # skip "List of devices attached"
                 for parts in [line.split()]
                 if len(parts) >= 2 and parts[1].lower() == "device"
             ]
@@ -152,9 +161,10 @@ class GSIFlasherUI(QMainWindow):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
-        # Log output
-        self.log_output = QTextEdit()
+        # Log output: plain text appends cheaply, and old lines are dropped so a long flash can't grow it forever
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(_LOG_MAX_LINES)
         self.log_output.setMinimumHeight(260)
         layout.addWidget(self.log_output)
 
@@ -222,15 +232,29 @@ class GSIFlasherUI(QMainWindow):
     def log(self, message: str):
         ts = time.strftime("%H:%M:%S")
         try:
-            self.log_output.append(f"[{ts}] {message}")
+            self.log_output.appendPlainText(f"[{ts}] {message}")
             self.log_output.ensureCursorVisible()
         except Exception:
             print(f"[{ts}] {message}")
 
+    def log_many(self, lines: list):
+        """Log a batch of lines with a single append."""
+        ts = time.strftime("%H:%M:%S")
+        text = "\n".join(f"[{ts}] {line}" for line in lines)
+        try:
+            self.log_output.appendPlainText(text)
+            self.log_output.ensureCursorVisible()
+        except Exception:
+            print(text)
+
     # ---- Command execution ----
 
-    def run_command_async(self, command, callback=None):
-        """Execute an ADB/Fastboot command via CommandRunner, log output, call callback on finish."""
+    def run_command_async(self, command, callback=None, tail=None):
+        """Execute an ADB/Fastboot command via CommandRunner, log output, call callback on finish.
+
+        The callback gets the command's output; pass tail=N to keep only the last N lines for it
+        (every line is still logged). Returns the runner, whose returncode is set once it finishes.
+        """
         from util.devicemanager import DeviceManager
         serial_args = DeviceManager.instance().serial_args()
 
@@ -241,23 +265,29 @@ class GSIFlasherUI(QMainWindow):
         else:
             cmd_str = command
 
-        thread = CommandRunner(cmd_str, self.platform_tools_path)
-        captured_output = []
+        thread = CommandRunner(cmd_str, self.platform_tools_path, batch_lines=True)
+        captured_output = deque(maxlen=tail)
 
         def handle_output(text, tag):
             self.log(text)
             captured_output.append(text)
 
+        def handle_lines(lines, tag):
+            self.log_many(lines)
+            captured_output.extend(lines)
+
         def handle_finished():
             if callback:
                 callback("\n".join(captured_output))
             if thread in self.command_threads:
                 self.command_threads.remove(thread)
 
-        thread.output_signal.connect(handle_output)
+        thread.output_signal.connect(handle_output)  # runner errors still arrive one at a time
+        thread.output_lines_signal.connect(handle_lines)
         thread.finished.connect(handle_finished)
         self.command_threads.append(thread)
         thread.start()
+        return thread
 
     def _tool_path(self, tool_name: str) -> str:
         return getattr(ToolPaths.instance(), tool_name, ToolPaths.instance().adb)
@@ -379,18 +409,15 @@ class GSIFlasherUI(QMainWindow):
         super_partition_size = None
         system_partition_size = None
 
-        for line in output.splitlines():
-            out_line = line.lower()
-            if "partition-size:super" in out_line:
-                try:
-                    super_partition_size = int(out_line.split(":")[-1].strip(), 16) / (1024 ** 3)
-                except ValueError:
-                    super_partition_size = 1.0
-            elif "partition-size:system" in out_line:
-                try:
-                    system_partition_size = int(out_line.split(":")[-1].strip(), 16) / (1024 ** 3)
-                except ValueError:
-                    system_partition_size = 1.0
+        for m in _PARTITION_SIZE_RE.finditer(output):
+            try:
+                size = int(m.group(2), 16) / (1024 ** 3)
+            except ValueError:
+                size = 1.0
+            if m.group(1).lower() == "super":
+                super_partition_size = size
+            else:
+                system_partition_size = size
 
         if system_partition_size:
             self.system_partition_available = True
@@ -478,15 +505,20 @@ class GSIFlasherUI(QMainWindow):
         self.flash_gsi_btn.setEnabled(False)
 
         def on_finished(output):
-            if "finished" in output.lower() or "success" in output.lower():
-                self.log("[INFO] Flash finished (heuristic success).")
+            if runner.returncode is not None:
+                ok = runner.returncode == 0
+            else:
+                ok = "finished" in output.lower() or "success" in output.lower()
+            if ok:
+                self.log("[INFO] Flash finished successfully.")
                 QMessageBox.information(self, "Flash Complete", "Flashing appears to have completed. Consider wiping data if required.")
             else:
                 self.log("[ERROR] Flash finished; inspect logs for errors.")
                 QMessageBox.critical(self, "Flash Completed", "Flash ended. Check logs for success/failure.")
             self.flash_gsi_btn.setEnabled(True)
 
-        self.run_command_async([self._fastboot, "flash", "system", self.gsi_image_path], on_finished)
+        # a flash logs a lot; the result only needs fastboot's exit code and the last lines
+        runner = self.run_command_async([self._fastboot, "flash", "system", self.gsi_image_path], on_finished, tail=64)
 
     # ---- Partition deletion and utilities ----
 